@@ -2,87 +2,645 @@
 Model utilities for downloading and managing LLM models.
 """
 
-import socket
-import urllib.error
-import urllib.request
+import errno
+import functools
+import hashlib
+import os
+import re
+import shutil
+import sys
+import threading
+import time
+from concurrent.futures import (
+    Future,
+    ThreadPoolExecutor,
+    as_completed,
+)
 from pathlib import Path
-from typing import Any, ClassVar, Dict, Optional
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    ClassVar,
+    Dict,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+)
+from urllib.parse import urljoin
 
 from src.app.config.settings import settings
 
+# The network stack (urllib3 pulls in ssl, http.client, ...) is imported on
+# first download; the usual startup path only checks the model exists
+if TYPE_CHECKING:
+    import urllib3
+
+__all__ = ["ModelDownloader", "ModelSpec"]
+
+# Matches the total size in a "Content-Range: bytes 0-0/12345" header
+CONTENT_RANGE_TOTAL = re.compile(r"/(\d+)\s*$")
+
+# Progress lines are written to stderr as pre-encoded bytes; the emoji is
+# only used when the console can display it without a lossy re-encode
+_STDERR_ENCODING = (getattr(sys.stderr, "encoding", None) or "").lower()
+_PROGRESS_PREFIX = "⏳ " if _STDERR_ENCODING.replace("-", "").startswith("utf") else ""
+PROGRESS_LINE = f"\r{_PROGRESS_PREFIX}Download progress: %d%%".encode()
+DOWNLOADED_LINE = f"\r{_PROGRESS_PREFIX}Downloaded: %dMB".encode()
+
+
+def _write_progress(line: bytes) -> None:
+    """Write a progress line to stderr, bypassing the text layer if possible."""
+    stream = getattr(sys.stderr, "buffer", None)
+    if stream is not None:
+        stream.write(line)
+        stream.flush()
+    elif sys.stderr is not None:
+        sys.stderr.write(line.decode())
+        sys.stderr.flush()
+
+
+class ModelSpec(NamedTuple):
+    """Download details for one ``MODEL_INFO`` entry."""
+
+    filename: str
+    url: str
+    size_mb: int
+    sha256: Optional[str] = None
+
+    @classmethod
+    def from_info(cls, info: Dict[str, Any]) -> "ModelSpec":
+        """Build a spec from a settings dictionary."""
+        return cls(info["filename"], info["url"], info["size_mb"], info.get("sha256"))
+
 
 class ModelDownloader:
     """Handles automatic model downloading."""
 
     MODEL_INFO: ClassVar[Dict[str, Dict[str, Any]]] = settings.model.MODEL_INFO
+    MODEL_SPECS: ClassVar[Dict[str, ModelSpec]] = {
+        name: ModelSpec.from_info(info) for name, info in MODEL_INFO.items()
+    }
+
+    # Shared across calls so repeat requests reuse open keep-alive connections
+    _pool: ClassVar[Optional["urllib3.PoolManager"]] = None
+    _pool_size: ClassVar[int] = 0
+    _pool_lock: ClassVar[threading.Lock] = threading.Lock()
 
     @staticmethod
+    @functools.lru_cache(maxsize=1)
     def get_models_dir() -> Path:
-        """Get the models directory from settings."""
+        """Get the models directory from settings, creating it once."""
         models_dir = settings.models_dir
-        models_dir.mkdir(exist_ok=True)
+        models_dir.mkdir(parents=True, exist_ok=True)
         return models_dir
 
+    @classmethod
+    def _get_pool(cls, num_connections: int) -> "urllib3.PoolManager":
+        """Get the shared connection pool, with ``num_connections`` per host.
+
+        A pool too small for the caller is replaced by a larger one; downloads
+        still running on the old pool keep using it until they finish.
+        """
+        import socket  # noqa: PLC0415
+
+        import urllib3  # noqa: PLC0415
+
+        with cls._pool_lock:
+            if cls._pool is None or cls._pool_size < num_connections:
+                size = max(num_connections, settings.model.DOWNLOAD_CONNECTIONS)
+                # One context for every connection: CA certificates are
+                # loaded once instead of per TLS handshake
+                ssl_context = urllib3.util.create_urllib3_context()
+                ssl_context.load_default_certs()
+                socket_options = list(
+                    urllib3.connection.HTTPConnection.default_socket_options
+                )
+                # A fixed receive buffer turns off the kernel's autotuning, so
+                # it is only set when configured; it must be set before
+                # connect, which urllib3 does for socket_options
+                rcvbuf = settings.model.DOWNLOAD_SOCKET_RCVBUF
+                if rcvbuf is not None:
+                    socket_options.append((socket.SOL_SOCKET, socket.SO_RCVBUF, rcvbuf))
+                cls._pool = urllib3.PoolManager(
+                    maxsize=size,
+                    socket_options=socket_options,
+                    block=True,
+                    headers={"Connection": "keep-alive"},
+                    ssl_context=ssl_context,
+                    retries=urllib3.Retry(total=5, backoff_factor=0.5),
+                    # Set timeouts to prevent hanging on Windows
+                    timeout=urllib3.Timeout(
+                        connect=settings.model.DOWNLOAD_TIMEOUT,
+                        read=settings.model.DOWNLOAD_TIMEOUT,
+                    ),
+                )
+                cls._pool_size = size
+            return cls._pool
+
+    @staticmethod
+    def _check_status(response: "urllib3.BaseHTTPResponse", *expected: int) -> None:
+        """Raise if the server answered with an unexpected status."""
+        import urllib3  # noqa: PLC0415
+
+        if response.status not in expected:
+            response.release_conn()
+            raise urllib3.exceptions.HTTPError(
+                f"Unexpected HTTP status {response.status} from {response.url}"
+            )
+
+    @staticmethod
+    def _probe_url(pool: "urllib3.PoolManager", url: str) -> Tuple[str, int, bool]:
+        """Return the resolved URL, total size and whether byte ranges work.
+
+        A one-byte range request is used instead of HEAD so redirects (the
+        HuggingFace resolve URL points at a CDN) are followed with the same
+        headers, and a 206 reply proves the server honours ``Range``.
+        """
+        response = pool.request(
+            "GET", url, headers={"Range": "bytes=0-0"}, preload_content=False
+        )
+        ModelDownloader._check_status(response, 200, 206)
+        # Later requests go straight to the final (CDN) location
+        resolved_url = url
+        for redirect in response.retries.history if response.retries else ():
+            if redirect.redirect_location:
+                resolved_url = urljoin(resolved_url, redirect.redirect_location)
+        if response.status == 206:  # noqa: PLR2004
+            response.drain_conn()
+            response.release_conn()
+            match = CONTENT_RANGE_TOTAL.search(
+                response.headers.get("Content-Range", "")
+            )
+            if match:
+                return resolved_url, int(match.group(1)), True
+            return resolved_url, 0, False
+        # Full body on the way - drop the connection instead of reading it,
+        # then hand the slot back; the pool blocks once maxsize are out
+        response.close()
+        response.release_conn()
+        total = int(response.headers.get("Content-Length") or 0)
+        return resolved_url, total, False
+
     @staticmethod
-    def download_model(model_name: str) -> Path:
-        """Download model if not present and return path."""
-        if model_name not in ModelDownloader.MODEL_INFO:
+    def _body_reader(response: "urllib3.BaseHTTPResponse") -> Callable[[Any], int]:
+        """Return a ``readinto`` for the response body.
+
+        For an undecoded body this is the underlying ``http.client`` reader,
+        which fills the caller's buffer straight from the socket; urllib3's
+        own ``readinto`` reads into a new ``bytes`` object and copies it.
+        Socket errors are wrapped the way urllib3 would wrap them, so callers
+        see the same exceptions on either path.
+        """
+        import http.client  # noqa: PLC0415
+        import socket  # noqa: PLC0415
+
+        import urllib3  # noqa: PLC0415
+
+        raw = getattr(response, "_fp", None)
+        encoding = response.headers.get("Content-Encoding", "identity")
+        if not isinstance(raw, http.client.HTTPResponse) or encoding != "identity":
+            return response.readinto
+        raw_readinto = raw.readinto
+        connection_pool: Any = getattr(response, "_pool", None)
+
+        def readinto(buffer: Any) -> int:
+            try:
+                return raw_readinto(buffer)
+            except socket.timeout as e:
+                raise urllib3.exceptions.ReadTimeoutError(
+                    connection_pool, response.url, "Read timed out."
+                ) from e
+            except (http.client.HTTPException, OSError) as e:
+                raise urllib3.exceptions.ProtocolError(
+                    f"Connection broken: {e!r}", e
+                ) from e
+
+        return readinto
+
+    @staticmethod
+    def _fill(readinto: Callable[[Any], int], buffer: memoryview) -> int:
+        """Read until ``buffer`` is full or the body ends; return bytes read."""
+        filled = 0
+        while filled < len(buffer):
+            count = readinto(buffer[filled:])
+            if not count:
+                break
+            filled += count
+        return filled
+
+    @staticmethod
+    def _file_size(path: Path) -> int:
+        """Size of ``path`` in bytes, or 0 if it does not exist (one stat)."""
+        try:
+            return path.stat().st_size
+        except FileNotFoundError:
+            return 0
+
+    @staticmethod
+    def _check_disk_space(directory: Path, required: int) -> None:
+        """Raise if ``directory`` cannot hold ``required`` more bytes."""
+        free = shutil.disk_usage(directory).free
+        needed = int(required * settings.model.DOWNLOAD_DISK_SPACE_MARGIN)
+        if free < needed:
+            raise RuntimeError(
+                f"Not enough disk space in {directory}: need "
+                f"{needed // (1024 * 1024)}MB, {free // (1024 * 1024)}MB free"
+            )
+
+    @staticmethod
+    def _preallocate(fd: int, size: int) -> bool:
+        """Reserve ``size`` bytes of disk for ``fd`` up front.
+
+        One allocation avoids the filesystem repeatedly extending the file
+        (and journalling each extent) while it grows. Returns ``False`` when
+        the platform or filesystem cannot preallocate.
+        """
+        if not hasattr(os, "posix_fallocate"):
+            return False
+        try:
+            os.posix_fallocate(fd, 0, size)
+        except OSError as e:
+            if e.errno in (errno.EINVAL, errno.EOPNOTSUPP):
+                return False
+            raise
+        return True
+
+    @staticmethod
+    def _download_ranges(  # noqa: PLR0913, PLR0915, PLR0917
+        pool: "urllib3.PoolManager",
+        url: str,
+        part_path: Path,
+        total: int,
+        num_connections: int,
+        chunk_size: int,
+        hasher: Optional["hashlib._Hash"],
+        on_progress: Callable[[int], None],
+    ) -> None:
+        """Download ``url`` with parallel range requests into ``part_path``.
+
+        Each range is written at its own offset with ``os.pwrite``, so the
+        workers never share a file position and need no locking. Every
+        worker reads into one reusable buffer of ``DOWNLOAD_WRITE_BATCH``
+        blocks and writes it with a single syscall once it is full. The
+        preallocated file has holes until every range lands, so on failure it
+        is cut back to the contiguous prefix of finished ranges, which the
+        single-stream path resumes.
+
+        When a ``hasher`` is given it is fed that prefix while later ranges
+        are still downloading, reading the bytes back while they are hot in
+        the page cache rather than in a separate pass over the finished file.
+        """
+        import urllib3  # noqa: PLC0415
+
+        block_size = settings.model.DOWNLOAD_BLOCK_SIZE
+        write_batch = settings.model.DOWNLOAD_WRITE_BATCH
+        failed = threading.Event()
+
+        def fetch_range(start: int, end: int) -> None:
+            response = pool.request(
+                "GET",
+                url,
+                headers={"Range": f"bytes={start}-{end}"},
+                preload_content=False,
+            )
+            ModelDownloader._check_status(response, 206)
+            readinto = ModelDownloader._body_reader(response)
+            buffer = memoryview(bytearray(block_size * write_batch))
+            offset = start
+            try:
+                while not failed.is_set():
+                    filled = ModelDownloader._fill(readinto, buffer)
+                    written = 0
+                    while written < filled:
+                        written += os.pwrite(
+                            fd, buffer[written:filled], offset + written
+                        )
+                    offset += filled
+                    on_progress(filled)
+                    if filled < len(buffer):
+                        break
+            finally:
+                response.release_conn()
+            if failed.is_set():
+                return
+            if offset != end + 1:
+                raise urllib3.exceptions.HTTPError(
+                    f"Incomplete range {start}-{end}: got {offset - start} bytes"
+                )
+
+        # Ranges finish out of order; done_to is where the run of finished
+        # ranges from the start of the file ends
+        done_to = 0
+        finished: Dict[int, int] = {}
+
+        def hash_range(digest: "hashlib._Hash", start: int, end: int) -> None:
+            while start <= end:
+                block = os.pread(fd, min(block_size, end + 1 - start), start)
+                digest.update(block)
+                start += len(block)
+
+        fd = os.open(part_path, os.O_RDWR | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            # Every range needs a home, so fall back to a sparse file
+            if not ModelDownloader._preallocate(fd, total):
+                os.ftruncate(fd, total)
+
+            executor = ThreadPoolExecutor(
+                max_workers=num_connections, thread_name_prefix="model-download"
+            )
+            futures: Dict[Future[None], Tuple[int, int]] = {}
+            try:
+                ranges = [
+                    (start, min(start + chunk_size, total) - 1)
+                    for start in range(0, total, chunk_size)
+                ]
+                futures = {
+                    executor.submit(fetch_range, start, end): (start, end)
+                    for start, end in ranges
+                }
+                for future in as_completed(futures):
+                    error = future.exception()
+                    if error is not None:
+                        raise error
+                    start, end = futures[future]
+                    finished[start] = end
+                    while done_to in finished:
+                        end = finished.pop(done_to)
+                        if hasher is not None:
+                            hash_range(hasher, done_to, end)
+                        done_to = end + 1
+            finally:
+                # Whatever ended the loop (a failed range, Ctrl+C, ...), stop
+                # the workers mid-range before waiting on them
+                failed.set()
+                # Drop the ranges still queued; shutdown's cancel_futures
+                # would do this, but only from Python 3.9
+                for future in futures:
+                    future.cancel()
+                executor.shutdown(wait=True)
+        except BaseException:
+            # Keep the finished prefix for the next attempt to resume
+            try:
+                if done_to:
+                    os.ftruncate(fd, done_to)
+            finally:
+                os.close(fd)
+            if not done_to:
+                part_path.unlink(missing_ok=True)
+            raise
+        os.close(fd)
+
+    @staticmethod
+    def _download_stream(  # noqa: PLR0913, PLR0917
+        pool: "urllib3.PoolManager",
+        url: str,
+        part_path: Path,
+        total: int,
+        hasher: Optional["hashlib._Hash"],
+        on_progress: Callable[[int], None],
+    ) -> None:
+        """Stream ``url`` into ``part_path``, resuming any earlier attempt.
+
+        Bytes already in ``part_path`` are requested with ``Range`` and only
+        the remainder is appended. A server that answers 200 instead of 206
+        sends the whole file, so the part file is truncated and refilled.
+        The file is not preallocated: its size is the resume offset, so it
+        must only ever hold bytes that were actually received.
+        """
+        import urllib3  # noqa: PLC0415
+
+        block_size = settings.model.DOWNLOAD_BLOCK_SIZE
+        resume_from = ModelDownloader._file_size(part_path)
+        headers = {"Range": f"bytes={resume_from}-"} if resume_from else {}
+        response = pool.request("GET", url, headers=headers, preload_content=False)
+        ModelDownloader._check_status(response, 200, 206)
+
+        try:
+            resuming = resume_from > 0 and response.status == 206  # noqa: PLR2004
+            if resuming:
+                print(f"↩️ Resuming from {resume_from // (1024 * 1024)}MB")
+                if hasher is not None:
+                    with open(part_path, "rb") as f:
+                        for block in iter(lambda: f.read(block_size), b""):
+                            hasher.update(block)
+                on_progress(resume_from)
+
+            readinto = ModelDownloader._body_reader(response)
+            buffer = memoryview(bytearray(block_size))
+            with open(part_path, "r+b" if resuming else "wb") as f:
+                f.seek(resume_from if resuming else 0)
+                while True:
+                    count = readinto(buffer)
+                    if not count:
+                        break
+                    chunk = buffer[:count]
+                    f.write(chunk)
+                    if hasher is not None:
+                        hasher.update(chunk)
+                    on_progress(count)
+                received = f.tell()
+            # The raw reader reports a dropped connection as a clean EOF
+            if 0 < total != received:
+                raise urllib3.exceptions.ProtocolError(
+                    f"Connection closed after {received} of {total} bytes"
+                )
+        finally:
+            response.release_conn()
+
+    @staticmethod
+    def _file_sha256(path: Path) -> str:
+        """Hash a finished download from disk."""
+        with open(path, "rb") as f:
+            if hasattr(hashlib, "file_digest"):  # Python 3.11+
+                digest: str = hashlib.file_digest(f, "sha256").hexdigest()
+                return digest
+            block_size = settings.model.DOWNLOAD_BLOCK_SIZE
+            hasher = hashlib.sha256()
+            for block in iter(lambda: f.read(block_size), b""):
+                hasher.update(block)
+            return hasher.hexdigest()
+
+    @staticmethod
+    def download_model(  # noqa: PLR0912, PLR0915
+        model_name: str,
+        num_connections: Optional[int] = None,
+        chunk_size: Optional[int] = None,
+    ) -> Path:
+        """Download model if not present and return path.
+
+        When the server supports byte ranges the file is fetched over
+        ``num_connections`` parallel requests of ``chunk_size`` bytes each;
+        otherwise it falls back to a single stream. Data lands in a ``.part``
+        file that is renamed into place once complete (and, when
+        ``MODEL_INFO`` carries a ``sha256``, verified). An interrupted
+        download leaves the bytes it completed from the start of the file in
+        ``.part``, and the next call resumes from there with a single stream.
+        """
+        spec = ModelDownloader.MODEL_SPECS.get(model_name)
+        if spec is None:
             raise ValueError(f"Unknown model: {model_name}")
 
-        model_info = ModelDownloader.MODEL_INFO[model_name]
-        models_dir = ModelDownloader.get_models_dir()
-        model_path = models_dir / model_info["filename"]
+        if num_connections is None:
+            num_connections = settings.model.DOWNLOAD_CONNECTIONS
+        if chunk_size is None:
+            chunk_size = settings.model.DOWNLOAD_CHUNK_SIZE
+
+        model_path = ModelDownloader.get_models_dir() / spec.filename
 
         if model_path.exists():
             print(f"✅ Model already exists: {model_path}")
-            return model_path  # type: ignore[no-any-return]
+            return model_path
+
+        import urllib3  # noqa: PLC0415
+
+        part_path = model_path.with_name(model_path.name + ".part")
+        expected_sha256 = spec.sha256
 
-        print(f"📥 Downloading {model_name} ({model_info['size_mb']}MB)...")
-        print(f"📍 URL: {model_info['url']}")
+        print(f"📥 Downloading {model_name} ({spec.size_mb}MB)...")
+        print(f"📍 URL: {spec.url}")
         print(f"💾 Saving to: {model_path}")
 
-        # Set socket timeout to prevent hanging on Windows
-        original_timeout: Optional[float] = socket.getdefaulttimeout()
+        pool = ModelDownloader._get_pool(num_connections)
 
         try:
-            socket.setdefaulttimeout(30)  # 30 seconds timeout
-
-            def progress_hook(block_num: int, block_size: int, total_size: int) -> None:
-                if total_size > 0:
-                    percent = min(100, (block_num * block_size * 100) // total_size)
-                    print(f"\r⏳ Download progress: {percent}%", end="", flush=True)
-                else:
-                    # Show downloaded bytes when total size is unknown
-                    downloaded = block_num * block_size
-                    print(
-                        f"\r⏳ Downloaded: {downloaded // (1024 * 1024)}MB",
-                        end="",
-                        flush=True,
-                    )
-
             print("🔗 Starting download...")
-            urllib.request.urlretrieve(model_info["url"], model_path, progress_hook)
+            url, total, accepts_ranges = ModelDownloader._probe_url(pool, spec.url)
+
+            lock = threading.Lock()
+            interval = settings.model.DOWNLOAD_PROGRESS_INTERVAL
+            downloaded = 0
+            last_report = 0.0
+            # The total is fixed for the transfer, so divide once up front
+            percent_per_byte = 100.0 / total if total > 0 else 0.0
+
+            def progress_hook(nbytes: int) -> None:
+                nonlocal downloaded, last_report
+                with lock:
+                    downloaded += nbytes
+                    # Repaint at most once per interval, but never skip 100%
+                    now = time.monotonic()
+                    finished = 0 < total <= downloaded
+                    if now - last_report < interval and not finished:
+                        return
+                    last_report = now
+                    if total > 0:
+                        percent = (
+                            100 if finished else int(downloaded * percent_per_byte)
+                        )
+                        _write_progress(PROGRESS_LINE % percent)
+                    else:
+                        # Show downloaded bytes when total size is unknown
+                        _write_progress(DOWNLOADED_LINE % (downloaded // (1024 * 1024)))
+
+            resume_from = ModelDownloader._file_size(part_path)
+            hasher = hashlib.sha256() if expected_sha256 else None
+
+            # A full-size part file may be a transfer that finished but missed
+            # the rename, or a preallocated file of zeros; only a matching
+            # checksum tells them apart, so without one start over
+            complete = False
+            if 0 < total == resume_from:
+                complete = bool(expected_sha256) and (
+                    ModelDownloader._file_sha256(part_path) == expected_sha256
+                )
+                if not complete:
+                    part_path.unlink()
+                    resume_from = 0
+
+            # Fail before transferring anything rather than at ENOSPC midway;
+            # size_mb is the fallback when the server sends no length
+            expected_size = total or spec.size_mb * 1024 * 1024
+            ModelDownloader._check_disk_space(
+                model_path.parent, max(0, expected_size - resume_from)
+            )
+
+            if complete:
+                actual_sha256 = expected_sha256
+            elif (
+                accepts_ranges
+                and total > 0
+                and resume_from == 0
+                and hasattr(os, "pwrite")
+            ):
+                print(f"🧵 Using {num_connections} parallel connections")
+                ModelDownloader._download_ranges(
+                    pool,
+                    url,
+                    part_path,
+                    total,
+                    num_connections,
+                    chunk_size,
+                    hasher,
+                    progress_hook,
+                )
+                actual_sha256 = hasher.hexdigest() if hasher else None
+            else:
+                if resume_from > total > 0:
+                    # Stale part file from a different build
+                    part_path.unlink(missing_ok=True)
+                ModelDownloader._download_stream(
+                    pool, url, part_path, total, hasher, progress_hook
+                )
+                actual_sha256 = hasher.hexdigest() if hasher else None
+
+            if expected_sha256 and actual_sha256 != expected_sha256:
+                part_path.unlink(missing_ok=True)
+                raise ValueError(
+                    f"Checksum mismatch for {model_name}: "
+                    f"expected {expected_sha256}, got {actual_sha256}"
+                )
+
+            os.replace(part_path, model_path)
             print(f"\n✅ Download complete: {model_path}")
 
-            return model_path  # type: ignore[no-any-return]
+            return model_path
 
-        except socket.timeout as e:
-            print("\n❌ Download timed out after 30 seconds")
-            if model_path.exists():
-                model_path.unlink()  # Remove incomplete file
+        except urllib3.exceptions.TimeoutError as e:
+            print(
+                f"\n❌ Download timed out after {settings.model.DOWNLOAD_TIMEOUT:g} seconds"
+            )
             raise Exception(
                 "Download timed out - please check your internet connection"
             ) from e
-        except urllib.error.URLError as e:
+        except urllib3.exceptions.HTTPError as e:
             print(f"\n❌ Network error: {e}")
-            if model_path.exists():
-                model_path.unlink()  # Remove incomplete file
             raise Exception(f"Network error during download: {e}") from e
         except Exception as e:
             print(f"\n❌ Download failed: {e}")
-            if model_path.exists():
-                model_path.unlink()  # Remove incomplete file
             raise
-        finally:
-            # Always restore original timeout
-            socket.setdefaulttimeout(original_timeout)
+
+    @staticmethod
+    def download_models(
+        model_names: Sequence[str], max_workers: Optional[int] = None
+    ) -> Dict[str, Path]:
+        """Download several models concurrently and return their paths.
+
+        Downloads share the class connection pool, and at most
+        ``MAX_PARALLEL_MODEL_DOWNLOADS`` run at once by default to stay
+        clear of per-IP rate limits on the model host.
+        """
+        names = list(dict.fromkeys(model_names))
+        if not names:
+            return {}
+        if max_workers is None:
+            max_workers = settings.model.MAX_PARALLEL_MODEL_DOWNLOADS
+        max_workers = min(len(names), max_workers)
+
+        # The models usually come from one host, so its pool has to fit every
+        # download's connections at once
+        ModelDownloader._get_pool(settings.model.DOWNLOAD_CONNECTIONS * max_workers)
+
+        paths: Dict[str, Path] = {}
+        with ThreadPoolExecutor(
+            max_workers=max_workers,
+            thread_name_prefix="model-prefetch",
+        ) as executor:
+            futures = {
+                executor.submit(ModelDownloader.download_model, name): name
+                for name in names
+            }
+            for future in as_completed(futures):
+                paths[futures[future]] = future.result()
+        return paths
@@ -1,10 +1,36 @@
 """
 Operations package for modular agent functionality.
 Each operation module handles specific platform-aware tasks.
+
+Operation classes are imported on first access (PEP 562), so importing the
+package does not load every operation module and its dependencies.
 """
 
-from .app_operations import AppOperations
-from .file_operations import FileOperations
-from .web_operations import WebOperations
+import importlib
+from typing import TYPE_CHECKING, Any, Dict, List
+
+if TYPE_CHECKING:
+    from .app_operations import AppOperations
+    from .file_operations import FileOperations
+    from .web_operations import WebOperations
+
+_LAZY_IMPORTS: Dict[str, str] = {
+    "AppOperations": ".app_operations",
+    "FileOperations": ".file_operations",
+    "WebOperations": ".web_operations",
+}
 
 __all__ = ["AppOperations", "FileOperations", "WebOperations"]
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value  # Later lookups skip __getattr__
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted({*globals(), *_LAZY_IMPORTS})
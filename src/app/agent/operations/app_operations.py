@@ -3,17 +3,71 @@ App Operations Module
 Handles application launching with fuzzy search across different platforms.
 """
 
+import contextlib
 import json
 import os
 import platform
+import re
+import shutil
+import stat
 import subprocess
-from pathlib import Path
-from typing import ClassVar, Dict, List, Optional
-
-from fuzzywuzzy import fuzz
+import sys
+import time
+from array import array
+from bisect import bisect_right
+from concurrent.futures import ThreadPoolExecutor
+from itertools import accumulate
+from typing import (
+    Any,
+    Callable,
+    ClassVar,
+    Dict,
+    FrozenSet,
+    Iterator,
+    KeysView,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+import numpy as np
+from rapidfuzz import fuzz, process
 
 from src.app.config.settings import settings
 
+# Both PowerShell probes in one process, since each launch costs far more than
+# the cmdlets themselves; @() keeps single results as arrays
+WINDOWS_APPS_SCRIPT = (
+    "$start = @(Get-StartApps | Select-Object Name, AppID); "
+    "$appx = @(Get-AppxPackage | Where-Object {$_.Name -notlike '*Microsoft.VCLibs*' "
+    "-and $_.Name -notlike '*Microsoft.NET*'} | "
+    "Select-Object Name, PackageFamilyName); "
+    "ConvertTo-Json @{start = $start; appx = $appx} -Depth 4 -Compress"
+)
+
+# One regex search per name instead of a substring scan per skip word; the
+# empty alternative never matches so an empty skip list skips nothing
+SKIP_EXECUTABLES_RE = re.compile(
+    "|".join(map(re.escape, settings.app_operations.SKIP_EXECUTABLES)) or "(?!)"
+)
+EXECUTABLE_BITS = stat.S_IXUSR | stat.S_IXGRP | stat.S_IXOTH
+
+
+# Programs found on PATH; misses are not kept, as the program may be
+# installed later, and discover_apps starts the cache over
+_WHICH_CACHE: Dict[str, str] = {}
+
+
+def _which(name: str) -> Optional[str]:
+    """shutil.which, remembered so repeated launches skip the PATH walk."""
+    path = _WHICH_CACHE.get(name)
+    if path is None:
+        path = shutil.which(name)
+        if path is not None:
+            _WHICH_CACHE[name] = path
+    return path
+
 
 class AppOperations:
     """Platform-aware application operations with fuzzy search."""
@@ -23,23 +77,75 @@ class AppOperations:
     FUZZY_THRESHOLD: ClassVar[int] = settings.app_operations.FUZZY_THRESHOLD
     COMMAND_TIMEOUT: ClassVar[int] = settings.app_operations.COMMAND_TIMEOUT
 
+    # Directories scanned during discovery, per platform
+    MACOS_APP_DIRS: ClassVar[List[str]] = [
+        "/Applications",
+        os.path.expanduser("~/Applications"),
+    ]
+    LINUX_DESKTOP_DIRS: ClassVar[List[str]] = [
+        "/usr/share/applications",
+        "/usr/local/share/applications",
+        os.path.expanduser("~/.local/share/applications"),
+    ]
+    LINUX_BIN_PATHS: ClassVar[List[str]] = ["/usr/bin", "/usr/local/bin", "/bin"]
+    WINDOWS_START_MENU_DIRS: ClassVar[List[str]] = [
+        os.path.expanduser("~/AppData/Roaming/Microsoft/Windows/Start Menu/Programs"),
+        "C:/ProgramData/Microsoft/Windows/Start Menu/Programs",
+    ]
+    # Store apps are not in the Start Menu, so watch their install root too
+    WINDOWS_APPS_DIR: ClassVar[str] = "C:/Program Files/WindowsApps"
+
+    # Last discovery result, its fingerprint and when it was scanned, shared
+    # by all instances
+    _shared_apps: ClassVar[Optional[Tuple[List[List[Any]], Dict[str, str], float]]] = (
+        None
+    )
+
     def __init__(self) -> None:
         self.system = platform.system().lower()
+        # The platform never changes, so resolve per-platform handlers once
+        discoverers: Dict[str, Callable[[], Dict[str, str]]] = {
+            "darwin": self._discover_macos_apps,
+            "linux": self._discover_linux_apps,
+            "windows": self._discover_windows_apps,
+        }
+        launchers: Dict[str, Callable[[str], bool]] = {
+            "darwin": self._launch_macos_app,
+            "linux": self._launch_linux_app,
+            "windows": self._launch_windows_app,
+        }
+        self._discoverer = discoverers.get(self.system)
+        self._launcher = launchers.get(self.system)
+        # Windows launches by discovered path, other platforms by app name
+        self._launch_by_path = self.system == "windows"
         self._app_cache: Optional[Dict[str, str]] = None
+        # Per-app lookup data kept in parallel lists, built once per discovery
+        self._app_keys: List[str] = []
+        self._app_names: List[str] = []
+        self._app_words: List[FrozenSet[str]] = []
+        self._app_lens: array[int] = array("i")
+        self._app_stems: List[FrozenSet[str]] = []
+        self._app_short: List[bool] = []
+        self._app_bonus: List[int] = []
+        self._app_penalized: List[bool] = []
+        self._prefix_index: Dict[str, List[int]] = {}
+        self._stem_index: Dict[str, List[int]] = {}
+        self._short_name_index: Dict[str, List[int]] = {}
+        self._joined_names = ""
+        self._name_offsets: List[int] = []
+        self._match_cache: Dict[Tuple[str, int], Optional[str]] = {}
 
     def _discover_macos_apps(self) -> Dict[str, str]:
         """Discover macOS applications."""
         apps = {}
-        app_dirs = ["/Applications", os.path.expanduser("~/Applications")]
 
-        for apps_dir in app_dirs:
-            if not os.path.exists(apps_dir):
-                continue
+        for apps_dir in self.MACOS_APP_DIRS:
             try:
-                for item in os.listdir(apps_dir):
-                    if item.endswith(".app"):
-                        app_name = item.replace(".app", "")
-                        apps[app_name.lower()] = os.path.join(apps_dir, item)
+                with os.scandir(apps_dir) as entries:
+                    for entry in entries:
+                        if entry.name.endswith(".app"):
+                            app_name = entry.name.replace(".app", "")
+                            apps[app_name.lower()] = entry.path
             except OSError:
                 continue
         return apps
@@ -49,191 +155,409 @@ class AppOperations:
         apps = {}
 
         # Check desktop files
-        desktop_dirs = [
-            "/usr/share/applications",
-            "/usr/local/share/applications",
-            os.path.expanduser("~/.local/share/applications"),
-        ]
-
-        for app_dir in desktop_dirs:
-            if not os.path.exists(app_dir):
-                continue
+        for app_dir in self.LINUX_DESKTOP_DIRS:
             try:
-                for item in os.listdir(app_dir):
-                    if item.endswith(".desktop"):
-                        app_name = item.replace(".desktop", "").replace("-", " ")
-                        apps[app_name.lower()] = os.path.join(app_dir, item)
+                with os.scandir(app_dir) as entries:
+                    for entry in entries:
+                        if entry.name.endswith(".desktop"):
+                            app_name = entry.name.replace(".desktop", "")
+                            app_name = app_name.replace("-", " ")
+                            apps[app_name.lower()] = entry.path
             except OSError:
                 continue
 
         # Check bin paths
-        bin_paths = ["/usr/bin", "/usr/local/bin", "/bin"]
-        for bin_path in bin_paths:
-            if not os.path.exists(bin_path):
-                continue
+        for bin_path in self.LINUX_BIN_PATHS:
+            if len(apps) >= self.MAX_APPS_LIMIT:
+                break
             try:
-                for item in os.listdir(bin_path):
-                    if (
-                        os.access(os.path.join(bin_path, item), os.X_OK)
-                        and not any(
-                            skip in item.lower()
-                            for skip in settings.app_operations.SKIP_EXECUTABLES
-                        )
-                        and len(apps) < self.MAX_APPS_LIMIT
-                    ):
-                        apps[item.lower()] = os.path.join(bin_path, item)
+                with os.scandir(bin_path) as entries:
+                    for entry in entries:
+                        item_lower = entry.name.lower()
+                        if SKIP_EXECUTABLES_RE.search(item_lower):
+                            continue
+                        try:
+                            mode = entry.stat().st_mode
+                        except OSError:
+                            continue
+                        if stat.S_ISREG(mode) and mode & EXECUTABLE_BITS:
+                            apps[item_lower] = entry.path
+                            if len(apps) >= self.MAX_APPS_LIMIT:
+                                break
             except OSError:
                 continue
         return apps
 
-    def _discover_windows_apps(self) -> Dict[str, str]:  # noqa: PLR0912, PLR0915
-        """Discover Windows applications using proper PowerShell methods."""
-        apps = {}
-
-        # Method 1: Get-StartApps - Gets all installed apps with AppIDs
+    @staticmethod
+    def _scan_files(root: str, suffix: str) -> Iterator["os.DirEntry[str]"]:
+        """Yield files under root whose name ends with suffix, top-down."""
+        pending = [root]
+        while pending:
+            subdirs = []
+            try:
+                with os.scandir(pending.pop()) as entries:
+                    for entry in entries:
+                        if entry.is_dir(follow_symlinks=False):
+                            subdirs.append(entry.path)
+                        elif entry.name.lower().endswith(suffix):
+                            yield entry
+            except OSError:
+                # Unreadable, or failed partway: still walk the subdirectories
+                # listed before the error
+                pass
+            pending.extend(reversed(subdirs))
+
+    def _run_powershell(self, command: str) -> "subprocess.CompletedProcess[str]":
+        """Run a PowerShell command without loading the user's profile."""
+        return subprocess.run(
+            ["powershell", "-NoProfile", "-NonInteractive", "-Command", command],
+            check=False,
+            capture_output=True,
+            text=True,
+            timeout=15,
+        )
+
+    @staticmethod
+    def _as_list(value: Any) -> List[Any]:
+        """ConvertTo-Json emits a bare object instead of a one-item array."""
+        if isinstance(value, list):
+            return value
+        return [value] if isinstance(value, dict) else []
+
+    def _discover_powershell_apps(self) -> Dict[str, str]:
+        """Methods 1 and 2: Get-StartApps and Get-AppxPackage in one process."""
+        apps: Dict[str, str] = {}
         try:
-            print("Discovering apps using Get-StartApps...")
-            result = subprocess.run(
-                ["powershell", "-Command", "Get-StartApps | ConvertTo-Json"],
-                check=False,
-                capture_output=True,
-                text=True,
-                timeout=15,
-            )
-
-            if result.returncode == 0 and result.stdout.strip():
-                start_apps = json.loads(result.stdout)
-                if isinstance(start_apps, list):
-                    for app in start_apps:
-                        if app.get("Name") and app.get("AppID"):
-                            app_name = app["Name"].strip()
-                            app_id = app["AppID"].strip()
-                            if app_name and len(app_name) > 1:
-                                apps[app_name.lower()] = f"appid:{app_id}"
-                                print(f"Found app: {app_name} -> {app_id}")
-                elif (
-                    isinstance(start_apps, dict)
-                    and start_apps.get("Name")
-                    and start_apps.get("AppID")
-                ):
-                    # Single app case
-                    app_name = start_apps["Name"].strip()
-                    app_id = start_apps["AppID"].strip()
-                    if app_name and len(app_name) > 1:
-                        apps[app_name.lower()] = f"appid:{app_id}"
-                        print(f"Found app: {app_name} -> {app_id}")
+            print("Discovering apps using Get-StartApps and Get-AppxPackage...")
+            result = self._run_powershell(WINDOWS_APPS_SCRIPT)
+            if result.returncode != 0 or not result.stdout.strip():
+                return apps
+            found = json.loads(result.stdout)
         except Exception as e:
-            print(f"Error discovering apps with Get-StartApps: {e}")
+            print(f"Error discovering apps with PowerShell: {e}")
+            return apps
 
-        # Method 2: Get-AppxPackage - Gets Windows Store/UWP apps
-        try:
-            print("Discovering UWP apps using Get-AppxPackage...")
-            result = subprocess.run(
-                [
-                    "powershell",
-                    "-Command",
-                    "Get-AppxPackage | Where-Object {$_.Name -notlike '*Microsoft.VCLibs*' -and $_.Name -notlike '*Microsoft.NET*'} | Select-Object Name, PackageFamilyName, InstallLocation | ConvertTo-Json",
-                ],
-                check=False,
-                capture_output=True,
-                text=True,
-                timeout=15,
-            )
-
-            if result.returncode == 0 and result.stdout.strip():
-                packages = json.loads(result.stdout)
-                if isinstance(packages, list):
-                    for package in packages:
-                        if package.get("Name") and package.get("PackageFamilyName"):
-                            # Extract readable name from package name
-                            full_name = package["Name"]
-                            if "." in full_name:
-                                app_name = full_name.split(".")[-1]  # Get last part
-                            else:
-                                app_name = full_name
-
-                            if app_name and len(app_name) > 1:
-                                package_family = package["PackageFamilyName"]
-                                apps[app_name.lower()] = f"package:{package_family}"
-                                print(f"Found UWP app: {app_name} -> {package_family}")
-                elif (
-                    isinstance(packages, dict)
-                    and packages.get("Name")
-                    and packages.get("PackageFamilyName")
-                ):
-                    # Single package case
-                    full_name = packages["Name"]
-                    if "." in full_name:
-                        app_name = full_name.split(".")[-1]
-                    else:
-                        app_name = full_name
+        # Method 1: Get-StartApps - Gets all installed apps with AppIDs
+        for app in self._as_list(found.get("start")):
+            if app.get("Name") and app.get("AppID"):
+                app_name = app["Name"].strip()
+                app_id = app["AppID"].strip()
+                if app_name and len(app_name) > 1:
+                    apps[app_name.lower()] = f"appid:{app_id}"
+                    print(f"Found app: {app_name} -> {app_id}")
 
-                    if app_name and len(app_name) > 1:
-                        package_family = packages["PackageFamilyName"]
-                        apps[app_name.lower()] = f"package:{package_family}"
-                        print(f"Found UWP app: {app_name} -> {package_family}")
-        except Exception as e:
-            print(f"Error discovering UWP apps with Get-AppxPackage: {e}")
+        # Method 2: Get-AppxPackage - Gets Windows Store/UWP apps
+        for package in self._as_list(found.get("appx")):
+            if package.get("Name") and package.get("PackageFamilyName"):
+                # Extract readable name from package name (last dotted part)
+                app_name = package["Name"].split(".")[-1]
+
+                if app_name and len(app_name) > 1:
+                    package_family = package["PackageFamilyName"]
+                    apps[app_name.lower()] = f"package:{package_family}"
+                    print(f"Found UWP app: {app_name} -> {package_family}")
+        return apps
 
-        # Method 3: Start Menu shortcuts (fallback)
+    def _discover_start_menu_shortcuts(self) -> Dict[str, str]:
+        """Method 3: Start Menu shortcuts (fallback)."""
+        apps: Dict[str, str] = {}
         try:
             print("Discovering Start Menu shortcuts...")
-            start_menu_paths = [
-                Path.home()
-                / "AppData"
-                / "Roaming"
-                / "Microsoft"
-                / "Windows"
-                / "Start Menu"
-                / "Programs",
-                Path("C:/ProgramData/Microsoft/Windows/Start Menu/Programs"),
-            ]
-
-            for start_path in start_menu_paths:
-                if start_path.exists():
-                    for lnk_file in start_path.rglob("*.lnk"):
-                        try:
-                            app_name = lnk_file.stem
-                            if (
-                                app_name
-                                and len(app_name) > 1
-                                and app_name.lower() not in apps
-                            ):
-                                # Only add if not already found by PowerShell methods
-                                apps[app_name.lower()] = str(lnk_file)
-                                print(f"Found shortcut: {app_name} -> {lnk_file}")
-                        except Exception:
-                            continue
+            for start_path in self.WINDOWS_START_MENU_DIRS:
+                for lnk_file in self._scan_files(start_path, ".lnk"):
+                    app_name = lnk_file.name[: -len(".lnk")]
+                    if app_name and len(app_name) > 1:
+                        apps.setdefault(app_name.lower(), lnk_file.path)
         except Exception as e:
             print(f"Error discovering Start Menu apps: {e}")
+        return apps
+
+    def _discover_windows_apps(self) -> Dict[str, str]:
+        """Discover Windows applications using proper PowerShell methods."""
+        # The PowerShell probe and the shortcut walk are independent, so run
+        # them side by side and wait for the slower one only
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            installed = executor.submit(self._discover_powershell_apps)
+            shortcuts = executor.submit(self._discover_start_menu_shortcuts)
+
+        apps = installed.result()
+        # Only add shortcuts not already found by PowerShell methods
+        for app_name, lnk_file in shortcuts.result().items():
+            if app_name not in apps:
+                apps[app_name] = lnk_file
+                print(f"Found shortcut: {app_name} -> {lnk_file}")
 
         print(f"Discovered {len(apps)} total Windows applications")
         return apps
 
-    def discover_apps(self) -> List[str]:
-        """Discover available applications on the system."""
+    def _watched_dirs(self) -> List[str]:
+        """Directories whose contents determine the discovered apps."""
+        if self.system == "darwin":
+            return self.MACOS_APP_DIRS
+        if self.system == "linux":
+            return self.LINUX_DESKTOP_DIRS + self.LINUX_BIN_PATHS
+        if self.system == "windows":
+            return [*self.WINDOWS_START_MENU_DIRS, self.WINDOWS_APPS_DIR]
+        return []
+
+    def _discovery_fingerprint(self) -> List[List[Any]]:
+        """Modification times of the watched directories that exist."""
+        fingerprint: List[List[Any]] = [[self.system, self.MAX_APPS_LIMIT]]
+        for directory in self._watched_dirs():
+            try:
+                fingerprint.append([directory, os.stat(directory).st_mtime_ns])
+            except OSError:
+                continue
+        return fingerprint
+
+    @staticmethod
+    def _cache_is_fresh(saved_at: Any) -> bool:
+        """Whether a scan made at ``saved_at`` is recent enough to reuse.
+
+        Not every change shows up in the fingerprint: a shortcut added to a
+        Start Menu subfolder leaves the watched folder's mtime alone. Scans
+        older than APP_CACHE_MAX_AGE are redone for that reason.
+        """
+        if not isinstance(saved_at, (int, float)):
+            return False
+        age = time.time() - saved_at
+        return 0 <= age <= settings.app_operations.APP_CACHE_MAX_AGE
+
+    def _load_cached_apps(
+        self, fingerprint: List[List[Any]]
+    ) -> Optional[Tuple[Dict[str, str], float]]:
+        """Return previously discovered apps and their scan time if current."""
+        # Other instances in this process may have scanned already
+        shared = AppOperations._shared_apps
+        if (
+            shared is not None
+            and shared[0] == fingerprint
+            and self._cache_is_fresh(shared[2])
+        ):
+            return dict(shared[1]), shared[2]
+
         try:
-            if self.system == "darwin":
-                apps_dict = self._discover_macos_apps()
-            elif self.system == "linux":
-                apps_dict = self._discover_linux_apps()
-            elif self.system == "windows":
-                apps_dict = self._discover_windows_apps()
-            else:
+            with open(settings.app_operations.APP_CACHE_FILE, encoding="utf-8") as f:
+                cached = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if (
+            not isinstance(cached, dict)
+            or cached.get("fingerprint") != fingerprint
+            or not self._cache_is_fresh(cached.get("saved_at"))
+        ):
+            return None
+        apps = cached.get("apps")
+        return (apps, cached["saved_at"]) if isinstance(apps, dict) else None
+
+    def _save_cached_apps(
+        self, fingerprint: List[List[Any]], apps: Dict[str, str], saved_at: float
+    ) -> None:
+        """Write the discovered apps to disk, replacing the cache atomically."""
+        cache_file = settings.app_operations.APP_CACHE_FILE
+        tmp_file = f"{cache_file}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(os.path.dirname(cache_file), exist_ok=True)
+            with open(tmp_file, "w", encoding="utf-8") as f:
+                json.dump(
+                    {"fingerprint": fingerprint, "saved_at": saved_at, "apps": apps},
+                    f,
+                )
+            os.replace(tmp_file, cache_file)
+        except OSError as e:
+            print(f"Warning: Could not save app cache: {e}")
+            with contextlib.suppress(OSError):
+                os.unlink(tmp_file)
+
+    def discover_apps(self) -> KeysView[str]:
+        """Discover available applications on the system."""
+        use_disk_cache = settings.development.CACHE_ENABLED
+        fingerprint = self._discovery_fingerprint() if use_disk_cache else []
+        cached = self._load_cached_apps(fingerprint) if use_disk_cache else None
+
+        if cached is not None:
+            apps_dict, saved_at = cached
+        else:
+            saved_at = time.time()
+            try:
+                apps_dict = self._discoverer() if self._discoverer else {}
+            except Exception as e:
+                print(f"Warning: Error discovering apps: {e}")
                 apps_dict = {}
-        except Exception as e:
-            print(f"Warning: Error discovering apps: {e}")
-            apps_dict = {}
+                use_disk_cache = False
+            else:
+                if use_disk_cache:
+                    self._save_cached_apps(fingerprint, apps_dict, saved_at)
+
+        if use_disk_cache:
+            AppOperations._shared_apps = (fingerprint, dict(apps_dict), saved_at)
 
         # Cache the full dictionary for launching
         self._app_cache = apps_dict
-        # Return just the app names for compatibility
-        return list(apps_dict.keys())
+        self._index_apps(apps_dict)
+        # Return just the app names, as a view rather than another list
+        return apps_dict.keys()
+
+    def _index_apps(self, apps: Dict[str, str]) -> None:
+        """Normalize app names once so queries only compare them."""
+        _WHICH_CACHE.clear()
+        self._app_keys = list(apps)
+        self._app_names = [app.lower().strip() for app in self._app_keys]
+        self._app_words = [frozenset(name.split()) for name in self._app_names]
+        self._app_lens = array("i", map(len, self._app_names))
+
+        # Everything the scorer needs from settings depends only on the app,
+        # so read each setting once here rather than once per app per query
+        min_stem = settings.app_operations.MIN_WORD_LENGTH_FOR_PARTIAL_MATCH
+        short_len = settings.app_operations.SHORT_APP_NAME_THRESHOLD
+        bonus_len = settings.app_operations.BONUS_APP_NAME_LENGTH
+        penalty_len = settings.app_operations.PENALTY_APP_NAME_LENGTH
+        self._app_stems = [
+            frozenset(word for word in words if len(word) >= min_stem)
+            for words in self._app_words
+        ]
+        self._app_short = [length <= short_len for length in self._app_lens]
+        self._app_bonus = [
+            10 if length <= bonus_len else 0 for length in self._app_lens
+        ]
+        self._app_penalized = [length > penalty_len for length in self._app_lens]
+
+        # Every prefix of each name and of each of its words, mapped to the
+        # apps it selects in cache order: exactly the apps in tiers 1-4
+        prefix_index: Dict[str, List[int]] = {}
+        for index, (name, words) in enumerate(zip(self._app_names, self._app_words)):
+            prefixes = {
+                text[:end] for text in (name, *words) for end in range(1, len(text) + 1)
+            }
+            for prefix in prefixes:
+                prefix_index.setdefault(prefix, []).append(index)
+        self._prefix_index = prefix_index
+
+        # Exact lookups for the partial word matches of tier 7 and the short
+        # names of tier 5, plus one string for C-level substring search
+        stem_index: Dict[str, List[int]] = {}
+        short_name_index: Dict[str, List[int]] = {}
+        for index, (name, stems) in enumerate(zip(self._app_names, self._app_stems)):
+            for stem in stems:
+                stem_index.setdefault(stem, []).append(index)
+            if self._app_short[index]:
+                short_name_index.setdefault(name, []).append(index)
+        self._stem_index = stem_index
+        self._short_name_index = short_name_index
+        self._joined_names = "\n".join(self._app_names)
+        self._name_offsets = list(
+            accumulate((length + 1 for length in self._app_lens[:-1]), initial=0)
+        )
+        self._match_cache.clear()
+
+    def _tier_candidates(self, query_lower: str, query_words: List[str]) -> List[int]:
+        """Indices of every app that some tier could match, in cache order."""
+        if not query_lower or "\n" in query_lower:
+            return list(range(len(self._app_keys)))
+
+        # Tiers 1-4, and tier 7 words that equal or start an app word
+        found = set(self._prefix_index.get(query_lower, ()))
+        for query_word in query_words:
+            found.update(self._prefix_index.get(query_word, ()))
+            # Tier 7 app words that start the query word
+            for end in range(1, len(query_word) + 1):
+                found.update(self._stem_index.get(query_word[:end], ()))
+
+        # Tier 5: short names contained in the query
+        longest = settings.app_operations.SHORT_APP_NAME_THRESHOLD
+        for start in range(len(query_lower) + 1):
+            for end in range(start, min(start + longest, len(query_lower)) + 1):
+                found.update(self._short_name_index.get(query_lower[start:end], ()))
+
+        # Tier 6: the query inside a name, found by str.find over all names
+        joined = self._joined_names
+        offsets = self._name_offsets
+        position = joined.find(query_lower)
+        while position != -1:
+            index = bisect_right(offsets, position) - 1
+            found.add(index)
+            next_name = offsets[index] + self._app_lens[index] + 1
+            position = joined.find(query_lower, next_name)
+
+        return sorted(found)
+
+    def _score_app(  # noqa: PLR0912
+        self, query_lower: str, query_words: List[str], index: int
+    ) -> int:
+        """Score one cached app against a query, or 0 if no tier matches."""
+        app_lower = self._app_names[index]
+        app_words = self._app_words[index]
+        app_len = self._app_lens[index]
+
+        # Priority 1: Exact match (highest priority)
+        if query_lower == app_lower:
+            score = 1000
+
+        # Priority 2: Query is exact word in app name
+        elif query_lower in app_words:
+            score = 950
+
+        # Priority 3: App starts with query
+        elif app_lower.startswith(query_lower):
+            score = 900 + int((len(query_lower) / app_len) * 50)
+
+        # Priority 4: Any word in app starts with query
+        elif any(word.startswith(query_lower) for word in app_words):
+            score = 850
+
+        # Priority 5: Query contains app name (for short app names)
+        elif self._app_short[index] and app_lower in query_lower:
+            score = 800
+
+        # Priority 6: Strong substring match
+        elif query_lower in app_lower:
+            # Prefer matches where query is a larger portion of the app name
+            score = 700 + int((len(query_lower) / app_len) * 100)
+
+        # Priority 7: Word-based matching
+        else:
+            word_matches = 0
+            partial_matches = 0
+
+            for query_word in query_words:
+                # Exact word match
+                if query_word in app_words:
+                    word_matches += 1
+                # Partial word match (word starts with query word)
+                elif any(
+                    app_word.startswith(query_word) for app_word in app_words
+                ) or any(
+                    query_word.startswith(app_word)
+                    for app_word in self._app_stems[index]
+                ):
+                    partial_matches += 1
+
+            if word_matches > 0:
+                score = 600 + (word_matches * 100) + (partial_matches * 25)
+            elif partial_matches > 0:
+                score = 400 + (partial_matches * 50)
+            else:
+                return 0
+
+        # Bonus for shorter app names (prefer specific matches)
+        score += self._app_bonus[index]
+
+        # Penalty for very long app names that might be less relevant
+        if self._app_penalized[index]:
+            score = int(score * 0.9)
+
+        return score
 
-    def find_app_fuzzy(  # noqa: PLR0912
+    def find_app_fuzzy(
         self, query: str, threshold: Optional[int] = None
     ) -> Optional[str]:
         """Find the best matching app using improved fuzzy search."""
+        return self.find_apps_fuzzy([query], threshold)[0]
+
+    def find_apps_fuzzy(
+        self, queries: Sequence[str], threshold: Optional[int] = None
+    ) -> List[Optional[str]]:
+        """Find the best matching app for each query, in one fuzzy pass."""
         if threshold is None:
             threshold = settings.app_operations.FUZZY_THRESHOLD
 
@@ -241,151 +565,230 @@ class AppOperations:
             self.discover_apps()
 
         if not self._app_cache:
-            return None
-
+            return [None] * len(queries)
+
+        # The same app names are usually asked for again and again, and the
+        # answer only changes when discover_apps rebuilds the index
+        query_lowers = [query.lower().strip() for query in queries]
+        matches: Dict[str, Optional[str]] = {}
+        fuzzy_queries: List[str] = []
+        fuzzy_unmatched: List[np.ndarray] = []
+        for query_lower in query_lowers:
+            if query_lower in matches:
+                continue
+            cache_key = (query_lower, threshold)
+            if cache_key in self._match_cache:
+                matches[query_lower] = self._match_cache[cache_key]
+                continue
+            best_match, unmatched = self._match_tiers(query_lower, threshold)
+            matches[query_lower] = best_match
+            if unmatched is not None:
+                fuzzy_queries.append(query_lower)
+                fuzzy_unmatched.append(unmatched)
+            else:
+                self._remember_match(cache_key, best_match)
+
+        if fuzzy_queries:
+            fuzzy_matches = self._match_fuzzy(fuzzy_queries, fuzzy_unmatched, threshold)
+            for query_lower, best_match in zip(fuzzy_queries, fuzzy_matches):
+                matches[query_lower] = best_match
+                self._remember_match((query_lower, threshold), best_match)
+
+        return [matches[query_lower] for query_lower in query_lowers]
+
+    def _remember_match(self, cache_key: Tuple[str, int], match: Optional[str]) -> None:
+        """Store a match result, dropping the oldest once the cache is full."""
+        if len(self._match_cache) >= settings.app_operations.MATCH_CACHE_SIZE:
+            del self._match_cache[next(iter(self._match_cache))]
+        self._match_cache[cache_key] = match
+
+    def _match_tiers(
+        self, query_lower: str, threshold: int
+    ) -> Tuple[Optional[str], Optional[np.ndarray]]:
+        """Rank the cached apps with the priority tiers.
+
+        Returns the best match, or when there is none, a mask of the apps
+        left for the fuzzy fallback (None if no app is left).
+        """
         best_match = None
         best_score = 0
 
-        query_lower = query.lower().strip()
         query_words = query_lower.split()
 
-        for app in self._app_cache:
-            app_lower = app.lower().strip()
-            app_words = app_lower.split()
-
-            score = 0
-
-            # Priority 1: Exact match (highest priority)
-            if query_lower == app_lower:
-                score = 1000
-
-            # Priority 2: Query is exact word in app name
-            elif query_lower in app_words:
-                score = 950
-
-            # Priority 3: App starts with query
-            elif app_lower.startswith(query_lower):
-                score = 900 + int((len(query_lower) / len(app_lower)) * 50)
-
-            # Priority 4: Any word in app starts with query
-            elif any(word.startswith(query_lower) for word in app_words):
-                score = 850
-
-            # Priority 5: Query contains app name (for short app names)
-            elif (
-                len(app_lower) <= settings.app_operations.SHORT_APP_NAME_THRESHOLD
-                and app_lower in query_lower
-            ):
-                score = 800
-
-            # Priority 6: Strong substring match
-            elif query_lower in app_lower:
-                # Prefer matches where query is a larger portion of the app name
-                score = 700 + int((len(query_lower) / len(app_lower)) * 100)
-
-            # Priority 7: Word-based matching
-            else:
-                word_matches = 0
-                partial_matches = 0
-
-                for query_word in query_words:
-                    # Exact word match
-                    if query_word in app_words:
-                        word_matches += 1
-                    # Partial word match (word starts with query word)
-                    elif any(
-                        app_word.startswith(query_word) for app_word in app_words
-                    ) or any(
-                        query_word.startswith(app_word)
-                        for app_word in app_words
-                        if len(app_word)
-                        >= settings.app_operations.MIN_WORD_LENGTH_FOR_PARTIAL_MATCH
-                    ):
-                        partial_matches += 1
-
-                if word_matches > 0:
-                    score = 600 + (word_matches * 100) + (partial_matches * 25)
-                elif partial_matches > 0:
-                    score = 400 + (partial_matches * 50)
-                else:
-                    # Fallback to fuzzy string matching
-                    fuzzy_score = fuzz.ratio(query_lower, app_lower)
-                    if (
-                        fuzzy_score >= settings.app_operations.FUZZY_MATCH_THRESHOLD
-                    ):  # Only consider good fuzzy matches
-                        score = fuzzy_score + 200  # Boost to compete with other methods
-
-            # Bonus for shorter app names (prefer specific matches)
-            if (
-                score > 0
-                and len(app_lower) <= settings.app_operations.BONUS_APP_NAME_LENGTH
-            ):
-                score += 10
-
-            # Penalty for very long app names that might be less relevant
-            if len(app_lower) > settings.app_operations.PENALTY_APP_NAME_LENGTH:
-                score = int(score * 0.9)
+        # Tiers 1-4 come straight from the prefix index. Tiers 5-7 score at
+        # most 810, or 610 + 100 per query word, so a better match found here
+        # cannot be beaten and the full scan is skipped.
+        for index in self._prefix_index.get(query_lower, ()):
+            score = self._score_app(query_lower, query_words, index)
+            if score > best_score and score >= threshold:
+                best_score = score
+                best_match = self._app_keys[index]
+        if best_score > max(810, 610 + 100 * len(query_words)):
+            return best_match, None
+
+        # Only apps some tier can match go through the Python scorer; the
+        # rest, and candidates that miss after all, are left for the fuzzy
+        # fallback
+        best_match = None
+        best_score = 0
+        unmatched = np.ones(len(self._app_keys), dtype=bool)
 
+        for index in self._tier_candidates(query_lower, query_words):
+            score = self._score_app(query_lower, query_words, index)
+            if not score:
+                continue
+            unmatched[index] = False
             if score > best_score and score >= threshold:
-                best_score = int(score)
-                best_match = app
+                best_score = score
+                best_match = self._app_keys[index]
+
+        # Fuzzy scores top out well below every tier above, so they only
+        # matter when nothing else matched
+        if best_match is not None or not unmatched.any():
+            return best_match, None
+        return None, unmatched
+
+    def _match_fuzzy(
+        self, queries: List[str], unmatched: List[np.ndarray], threshold: int
+    ) -> List[Optional[str]]:
+        """Best fuzzy match per query among the apps its tiers left over.
+
+        All queries are scored in one C++ call, and the boost, bonus and
+        penalty are applied to the whole score matrix.
+        """
+        # Scores are rounded before the threshold check, so anything from
+        # half a point below it still passes; work in half points
+        fuzzy_threshold = settings.app_operations.FUZZY_MATCH_THRESHOLD
+        cutoff = 2 * fuzzy_threshold - 1
+        app_lens = np.asarray(self._app_lens)
+
+        # fuzz.ratio is at most 100 * (1 - |a - b| / (a + b)) for lengths
+        # a and b, so skip names too much longer or shorter to reach it
+        query_lens = np.array([len(query) for query in queries])[:, np.newaxis]
+        in_reach = (
+            np.array(unmatched)
+            & (app_lens * cutoff <= query_lens * (400 - cutoff))
+            & (app_lens * (400 - cutoff) >= query_lens * cutoff)
+        )
+        candidates = np.flatnonzero(in_reach.any(axis=0))
+        if not len(candidates):
+            return [None] * len(queries)
+
+        fuzzy_scores = process.cdist(
+            queries,
+            [self._app_names[index] for index in candidates],
+            scorer=fuzz.ratio,
+            score_cutoff=cutoff / 2,
+            dtype=np.float64,
+            workers=-1,
+        )
+        fuzzy_scores = np.rint(fuzzy_scores)
+        # Boost to compete with other methods
+        scores = fuzzy_scores + 200
+        scores += np.asarray(self._app_bonus)[candidates]
+        penalized = np.asarray(self._app_penalized)[candidates]
+        scores[:, penalized] = np.floor(scores[:, penalized] * 0.9)
+        scores[
+            ~in_reach[:, candidates]
+            | (fuzzy_scores < fuzzy_threshold)
+            | (scores < threshold)
+        ] = 0
+
+        # argmax picks the first of equal scores, like the tier loop
+        positions = scores.argmax(axis=1)
+        return [
+            self._app_keys[candidates[position]] if scores[row, position] > 0 else None
+            for row, position in enumerate(positions)
+        ]
 
-        return best_match
+    def _spawn_detached(self, cmd: List[str]) -> bool:
+        """Start a launcher without waiting for the app it opens to exit.
+
+        Launchers such as open and gtk-launch exit as soon as the app is up,
+        and a command still running after the check timeout is the app
+        itself, so both count as launched; an early non-zero exit does not.
+        """
+        process = subprocess.Popen(
+            cmd,
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            start_new_session=True,
+        )
+        try:
+            return process.wait(settings.app_operations.LAUNCH_CHECK_TIMEOUT) == 0
+        except subprocess.TimeoutExpired:
+            return True
 
     def _launch_macos_app(self, app_name: str) -> bool:
         """Launch app on macOS."""
         try:
-            result = subprocess.run(
-                ["open", "-a", app_name],
-                check=False,
-                capture_output=True,
-                text=True,
-                timeout=self.COMMAND_TIMEOUT,
-            )
-            if result.returncode == 0:
+            if self._spawn_detached(["open", "-a", app_name]):
                 print(f"✅ Launched {app_name}")
                 return True
-            print(f"❌ Failed to launch {app_name}: {result.stderr}")
-            return False
-        except subprocess.TimeoutExpired:
-            print(f"⏰ Timeout launching {app_name}")
+        except OSError as e:
+            print(f"❌ Failed to launch {app_name}: {e}")
             return False
+        print(f"❌ Failed to launch {app_name}")
+        return False
 
     def _launch_linux_app(self, app_name: str) -> bool:
         """Launch app on Linux."""
-        commands = [
-            ["gtk-launch", app_name],
-            [app_name],
-            ["nohup", app_name],
-        ]
+        # Only try launchers that are on PATH, by full path so Popen does not
+        # search PATH again
+        commands: List[List[str]] = []
+        gtk_launch = _which("gtk-launch")
+        if gtk_launch:
+            commands.append([gtk_launch, app_name])
+        executable = _which(app_name)
+        if executable:
+            commands.append([executable])
+            nohup = _which("nohup")
+            if nohup:
+                commands.append([nohup, executable])
 
         for cmd in commands:
             try:
-                result = subprocess.run(
-                    cmd,
-                    check=False,
-                    capture_output=True,
-                    text=True,
-                    timeout=self.COMMAND_TIMEOUT,
-                )
-                if result.returncode == 0:
+                if self._spawn_detached(cmd):
                     print(f"✅ Launched {app_name}")
                     return True
-            except (subprocess.TimeoutExpired, OSError):
+            except OSError:
                 continue
 
         print(f"❌ Failed to launch {app_name}")
         return False
 
+    @staticmethod
+    def _shell_open(target: str) -> bool:
+        """Open a file, shortcut or shell: target with ShellExecute.
+
+        os.startfile returns as soon as the shell has the target, without a
+        cmd.exe or PowerShell process in between; failures raise OSError.
+        """
+        if sys.platform != "win32":
+            raise OSError(f"Cannot shell-open {target} on {sys.platform}")
+        os.startfile(target)
+        return True
+
     def _launch_windows_app(self, app_path: str) -> bool:  # noqa: PLR0911, PLR0912
         """Launch a Windows application using multiple methods."""
+        # One stat answers every existence and type check below
+        is_file = is_dir = False
+        if not app_path.startswith(("appid:", "package:")):
+            try:
+                mode = os.stat(app_path).st_mode
+                is_file = stat.S_ISREG(mode)
+                is_dir = stat.S_ISDIR(mode)
+            except (OSError, ValueError):
+                pass
+
         try:
             # Method 1: App ID launch (for apps discovered via Get-StartApps)
             if app_path.startswith("appid:"):
                 app_id = app_path[6:]  # Remove 'appid:' prefix
                 print(f"Launching app with ID: {app_id}")
 
-                # Try launching via PowerShell Start-Process with AppID
+                # Try launching through the shell with the AppID
                 try:
                     if app_id.startswith(("C:\\", "c:\\")):
                         # Direct executable path
@@ -393,20 +796,9 @@ class AppOperations:
                         return True
                     else:
                         # UWP App ID - use shell:appsFolder
-                        result = subprocess.run(
-                            [
-                                "powershell",
-                                "-Command",
-                                f'Start-Process "shell:appsFolder\\{app_id}"',
-                            ],
-                            check=False,
-                            capture_output=True,
-                            text=True,
-                            timeout=10,
-                        )
-                        return result.returncode == 0
+                        return self._shell_open(f"shell:appsFolder\\{app_id}")
                 except Exception as e:
-                    print(f"PowerShell launch failed: {e}")
+                    print(f"Shell launch failed: {e}")
 
                 # Fallback: Try with explorer shell:appsFolder
                 try:
@@ -423,41 +815,27 @@ class AppOperations:
                 print(f"Launching UWP package: {package_family}")
 
                 try:
-                    result = subprocess.run(
-                        [
-                            "powershell",
-                            "-Command",
-                            f'Start-Process "shell:appsFolder\\{package_family}!App"',
-                        ],
-                        check=False,
-                        capture_output=True,
-                        text=True,
-                        timeout=10,
-                    )
-                    return result.returncode == 0
+                    return self._shell_open(f"shell:appsFolder\\{package_family}!App")
                 except Exception as e:
                     print(f"UWP package launch failed: {e}")
 
             # Method 3: Direct execution for .exe files
-            elif app_path.endswith(".exe") and Path(app_path).exists():
+            elif app_path.endswith(".exe") and is_file:
                 print(f"Launching executable: {app_path}")
                 subprocess.Popen([app_path], shell=False)
                 return True
 
             # Method 4: Shell execution for .lnk files
-            elif app_path.endswith(".lnk") and Path(app_path).exists():
+            elif app_path.endswith(".lnk") and is_file:
                 print(f"Launching shortcut: {app_path}")
-                subprocess.Popen(
-                    ["cmd", "/c", "start", "", f'"{app_path}"'], shell=False
-                )
-                return True
+                return self._shell_open(app_path)
 
             # Method 5: Try as Windows Store app directory
-            elif Path(app_path).exists() and Path(app_path).is_dir():
+            elif is_dir:
                 print(f"Searching for executable in directory: {app_path}")
-                for exe_file in Path(app_path).rglob("*.exe"):
+                for exe_file in self._scan_files(app_path, ".exe"):
                     try:
-                        subprocess.Popen([str(exe_file)], shell=False)
+                        subprocess.Popen([exe_file.path], shell=False)
                         return True
                     except Exception:
                         continue
@@ -471,8 +849,12 @@ class AppOperations:
             print(f"Error launching Windows app {app_path}: {e}")
             return False
 
-    def launch_app(self, app_name: str) -> bool:  # noqa: PLR0911
+    def launch_app(self, app_name: str) -> bool:
         """Launch an application by name."""
+        if self._launcher is None:
+            print(f"❌ Unsupported system: {self.system}")
+            return False
+
         try:
             # First try fuzzy search
             matched_app = self.find_app_fuzzy(app_name)
@@ -481,28 +863,12 @@ class AppOperations:
                 app_path = self._app_cache[matched_app]
                 print(f"🎯 Found app: {matched_app} -> {app_path}")
 
-                if self.system == "darwin":
-                    return self._launch_macos_app(matched_app)
-                elif self.system == "linux":
-                    return self._launch_linux_app(matched_app)
-                elif self.system == "windows":
-                    return self._launch_windows_app(app_path)
-                else:
-                    print(f"❌ Unsupported system: {self.system}")
-                    return False
+                return self._launcher(app_path if self._launch_by_path else matched_app)
             else:
                 # Fallback to direct launch
                 print(f"🔍 Trying direct launch: {app_name}")
 
-                if self.system == "darwin":
-                    return self._launch_macos_app(app_name)
-                elif self.system == "linux":
-                    return self._launch_linux_app(app_name)
-                elif self.system == "windows":
-                    return self._launch_windows_app(app_name)
-                else:
-                    print(f"❌ Unsupported system: {self.system}")
-                    return False
+                return self._launcher(app_name)
 
         except Exception as e:
             print(f"❌ Error launching {app_name}: {e}")
@@ -3,11 +3,18 @@ File Operations Module
 Handles file and folder operations across different platforms.
 """
 
+import logging
+import os
 import platform
 import shutil
+import stat
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Union
 
+from src.app.config.settings import settings
+
+log = logging.getLogger(__name__)
+
 
 class FileOperations:
     """Platform-aware file and folder operations."""
@@ -25,11 +32,11 @@ class FileOperations:
             with open(path, "w", encoding="utf-8") as f:
                 f.write(content)
 
-            print(f"✅ Created file: {path}")
+            log.info("✅ Created file: %s", path)
             return True
 
         except Exception as e:
-            print(f"❌ Error creating file {file_path}: {e}")
+            log.error("❌ Error creating file %s: %s", file_path, e)
             return False
 
     def create_folder(self, folder_path: Union[str, Path]) -> bool:
@@ -37,43 +44,43 @@ class FileOperations:
         try:
             path = Path(folder_path)
             path.mkdir(parents=True, exist_ok=True)
-            print(f"✅ Created folder: {path}")
+            log.info("✅ Created folder: %s", path)
             return True
 
         except Exception as e:
-            print(f"❌ Error creating folder {folder_path}: {e}")
+            log.error("❌ Error creating folder %s: %s", folder_path, e)
             return False
 
     def delete_file(self, file_path: Union[str, Path]) -> bool:
         """Delete a file."""
         try:
             path = Path(file_path)
-            if path.exists() and path.is_file():
+            if path.is_file():
                 path.unlink()
-                print(f"✅ Deleted file: {path}")
+                log.info("✅ Deleted file: %s", path)
                 return True
             else:
-                print(f"❌ File not found: {path}")
+                log.error("❌ File not found: %s", path)
                 return False
 
         except Exception as e:
-            print(f"❌ Error deleting file {file_path}: {e}")
+            log.error("❌ Error deleting file %s: %s", file_path, e)
             return False
 
     def delete_folder(self, folder_path: Union[str, Path]) -> bool:
         """Delete a folder and its contents."""
         try:
             path = Path(folder_path)
-            if path.exists() and path.is_dir():
+            if path.is_dir():
                 shutil.rmtree(path)
-                print(f"✅ Deleted folder: {path}")
+                log.info("✅ Deleted folder: %s", path)
                 return True
             else:
-                print(f"❌ Folder not found: {path}")
+                log.error("❌ Folder not found: %s", path)
                 return False
 
         except Exception as e:
-            print(f"❌ Error deleting folder {folder_path}: {e}")
+            log.error("❌ Error deleting folder %s: %s", folder_path, e)
             return False
 
     def copy_file(
@@ -85,18 +92,18 @@ class FileOperations:
             dest_path = Path(destination)
 
             if not src_path.exists():
-                print(f"❌ Source file not found: {src_path}")
+                log.error("❌ Source file not found: %s", src_path)
                 return False
 
             # Create destination directory if needed
             dest_path.parent.mkdir(parents=True, exist_ok=True)
 
             shutil.copy2(src_path, dest_path)
-            print(f"✅ Copied {src_path} to {dest_path}")
+            log.info("✅ Copied %s to %s", src_path, dest_path)
             return True
 
         except Exception as e:
-            print(f"❌ Error copying file: {e}")
+            log.error("❌ Error copying file: %s", e)
             return False
 
     def copy_folder(
@@ -108,15 +115,15 @@ class FileOperations:
             dest_path = Path(destination)
 
             if not src_path.exists():
-                print(f"❌ Source folder not found: {src_path}")
+                log.error("❌ Source folder not found: %s", src_path)
                 return False
 
             shutil.copytree(src_path, dest_path, dirs_exist_ok=True)
-            print(f"✅ Copied folder {src_path} to {dest_path}")
+            log.info("✅ Copied folder %s to %s", src_path, dest_path)
             return True
 
         except Exception as e:
-            print(f"❌ Error copying folder: {e}")
+            log.error("❌ Error copying folder: %s", e)
             return False
 
     def move_file(
@@ -128,18 +135,18 @@ class FileOperations:
             dest_path = Path(destination)
 
             if not src_path.exists():
-                print(f"❌ Source file not found: {src_path}")
+                log.error("❌ Source file not found: %s", src_path)
                 return False
 
             # Create destination directory if needed
             dest_path.parent.mkdir(parents=True, exist_ok=True)
 
             shutil.move(str(src_path), str(dest_path))
-            print(f"✅ Moved {src_path} to {dest_path}")
+            log.info("✅ Moved %s to %s", src_path, dest_path)
             return True
 
         except Exception as e:
-            print(f"❌ Error moving file: {e}")
+            log.error("❌ Error moving file: %s", e)
             return False
 
     def move_folder(
@@ -151,60 +158,92 @@ class FileOperations:
             dest_path = Path(destination)
 
             if not src_path.exists():
-                print(f"❌ Source folder not found: {src_path}")
+                log.error("❌ Source folder not found: %s", src_path)
                 return False
 
             shutil.move(str(src_path), str(dest_path))
-            print(f"✅ Moved folder {src_path} to {dest_path}")
+            log.info("✅ Moved folder %s to %s", src_path, dest_path)
             return True
 
         except Exception as e:
-            print(f"❌ Error moving folder: {e}")
+            log.error("❌ Error moving folder: %s", e)
             return False
 
     def list_directory(self, directory_path: Union[str, Path]) -> Optional[List[str]]:
         """List contents of a directory."""
         try:
             path = Path(directory_path)
-            if not path.exists():
-                print(f"❌ Directory not found: {path}")
+            # scandir reports each entry's type from the directory read
+            # itself, so there is no stat per entry
+            try:
+                with os.scandir(path) as it:
+                    entries = [(e.name, e.is_dir()) for e in it]
+            except FileNotFoundError:
+                log.error("❌ Directory not found: %s", path)
                 return None
-
-            if not path.is_dir():
-                print(f"❌ Not a directory: {path}")
+            except NotADirectoryError:
+                log.error("❌ Not a directory: %s", path)
                 return None
 
-            contents = [item.name for item in path.iterdir()]
-            print(f"📁 Directory contents of {path}:")
-            for item in sorted(contents):
-                item_path = path / item
-                if item_path.is_dir():
-                    print(f"  📁 {item}/")
-                else:
-                    print(f"  📄 {item}")
+            # Sorting and per-entry lines are only worth it if someone sees them
+            if log.isEnabledFor(logging.INFO):
+                log.info("📁 Directory contents of %s:", path)
+                for item, is_dir in sorted(entries):
+                    if is_dir:
+                        log.info("  📁 %s/", item)
+                    else:
+                        log.info("  📄 %s", item)
 
+            contents = [name for name, _ in entries]
             return contents
 
         except Exception as e:
-            print(f"❌ Error listing directory {directory_path}: {e}")
+            log.error("❌ Error listing directory %s: %s", directory_path, e)
             return None
 
+    @staticmethod
+    def _read_sized(path: Path, size: int) -> str:
+        """Read a file of known ``size`` into one buffer and decode it.
+
+        A text-mode read of a large file grows its bytes buffer as it goes
+        and copies it before decoding; here the buffer is allocated once and
+        filled in place. Newlines are translated the way text mode does it.
+        """
+        buffer = bytearray(size)
+        with open(path, "rb") as f:
+            count = f.readinto(buffer)
+            if count < size:
+                # Truncated since the stat
+                del buffer[count:]
+            else:
+                # Or grown since the stat
+                buffer += f.read()
+        content = buffer.decode("utf-8")
+        if "\r" in content:
+            content = content.replace("\r\n", "\n").replace("\r", "\n")
+        return content
+
     def read_file(self, file_path: Union[str, Path]) -> Optional[str]:
         """Read content from a file."""
         try:
             path = Path(file_path)
-            if not path.exists():
-                print(f"❌ File not found: {path}")
+            try:
+                size = os.stat(path).st_size
+            except FileNotFoundError:
+                log.error("❌ File not found: %s", path)
                 return None
 
-            with open(path, encoding="utf-8") as f:
-                content = f.read()
+            if size > settings.file_operations.SIZED_READ_THRESHOLD:
+                content = self._read_sized(path, size)
+            else:
+                with open(path, encoding="utf-8") as f:
+                    content = f.read()
 
-            print(f"✅ Read file: {path} ({len(content)} characters)")
+            log.info("✅ Read file: %s (%d characters)", path, len(content))
             return content
 
         except Exception as e:
-            print(f"❌ Error reading file {file_path}: {e}")
+            log.error("❌ Error reading file %s: %s", file_path, e)
             return None
 
     def write_file(
@@ -221,11 +260,11 @@ class FileOperations:
                 f.write(content)
 
             action = "Appended to" if append else "Wrote to"
-            print(f"✅ {action} file: {path}")
+            log.info("✅ %s file: %s", action, path)
             return True
 
         except Exception as e:
-            print(f"❌ Error writing to file {file_path}: {e}")
+            log.error("❌ Error writing to file %s: %s", file_path, e)
             return False
 
     def file_exists(self, file_path: Union[str, Path]) -> bool:
@@ -240,26 +279,28 @@ class FileOperations:
         """Get information about a file."""
         try:
             path = Path(file_path)
-            if not path.exists():
-                print(f"❌ File not found: {path}")
+            # One stat answers existence, type, size and mtime together
+            try:
+                st = os.stat(path)
+            except FileNotFoundError:
+                log.error("❌ File not found: %s", path)
                 return None
 
-            stat = path.stat()
             info = {
                 "name": path.name,
                 "path": str(path.absolute()),
-                "size": stat.st_size,
-                "modified": stat.st_mtime,
-                "is_file": path.is_file(),
-                "is_directory": path.is_dir(),
+                "size": st.st_size,
+                "modified": st.st_mtime,
+                "is_file": stat.S_ISREG(st.st_mode),
+                "is_directory": stat.S_ISDIR(st.st_mode),
             }
 
-            print(f"📋 File info for {path.name}:")
-            print(f"  Size: {info['size']} bytes")
-            print(f"  Type: {'File' if info['is_file'] else 'Directory'}")
+            log.info("📋 File info for %s:", path.name)
+            log.info("  Size: %d bytes", info["size"])
+            log.info("  Type: %s", "File" if info["is_file"] else "Directory")
 
             return info
 
         except Exception as e:
-            print(f"❌ Error getting file info for {file_path}: {e}")
+            log.error("❌ Error getting file info for %s: %s", file_path, e)
             return None
@@ -4,7 +4,9 @@ Handles web search operations without opening browser.
 """
 
 import platform
-from typing import Any, Dict, List, Optional
+import threading
+import time
+from typing import Any, ClassVar, Dict, List, Optional, Tuple
 
 try:
     from ddgs import DDGS
@@ -17,6 +19,84 @@ from src.app.config.settings import settings
 class WebOperations:
     """Platform-aware web search operations."""
 
+    # One DDGS client, and its HTTP session, shared by every instance
+    _shared_ddgs: ClassVar[Any] = None
+    _ddgs_lock: ClassVar[threading.Lock] = threading.Lock()
+
+    # How each search kind is run and shown: the DDGS method, message labels,
+    # (output key, DDGS key, default) fields, the field cut to snippet length
+    # and the lines printed under each result's title in verbose mode
+    SEARCH_KINDS: ClassVar[Dict[str, Dict[str, Any]]] = {
+        "web": {
+            "method": "text",
+            "searching": "🔍 Searching web",
+            "results": "search results",
+            "label": "web search",
+            "fields": [
+                ("title", "title", "No title"),
+                ("url", "href", ""),
+                ("snippet", "body", "No description"),
+            ],
+            "shorten": "snippet",
+            "lines": ["   {url}", "   {snippet}"],
+        },
+        "news": {
+            "method": "news",
+            "searching": "📰 Searching news",
+            "results": "news results",
+            "label": "news search",
+            "fields": [
+                ("title", "title", "No title"),
+                ("url", "url", ""),
+                ("snippet", "body", "No description"),
+                ("source", "source", "Unknown"),
+                ("date", "date", ""),
+            ],
+            "shorten": "snippet",
+            "lines": ["   Source: {source} | Date: {date}", "   {url}", "   {snippet}"],
+        },
+        "images": {
+            "method": "images",
+            "searching": "🖼️ Searching images",
+            "results": "image results",
+            "label": "image search",
+            "fields": [
+                ("title", "title", "No title"),
+                ("image_url", "image", ""),
+                ("thumbnail_url", "thumbnail", ""),
+                ("source", "source", ""),
+                ("width", "width", 0),
+                ("height", "height", 0),
+            ],
+            "shorten": None,
+            "lines": [
+                "   Size: {width}x{height}",
+                "   Image: {image_url}",
+                "   Source: {source}",
+            ],
+        },
+        "videos": {
+            "method": "videos",
+            "searching": "📹 Searching videos",
+            "results": "video results",
+            "label": "video search",
+            "fields": [
+                ("title", "title", "No title"),
+                ("url", "content", ""),
+                ("thumbnail", "thumbnail", ""),
+                ("description", "description", ""),
+                ("publisher", "publisher", ""),
+                ("duration", "duration", ""),
+            ],
+            "shorten": "description",
+            "lines": [
+                "   Publisher: {publisher} | Duration: {duration}",
+                "   {url}",
+                "   {description}",
+            ],
+        },
+    }
+
     # Use settings for constants
     @property
     def snippet_length(self) -> int:
@@ -28,54 +108,88 @@ class WebOperations:
 
     def __init__(self) -> None:
         self.system = platform.system().lower()
-        self._ddgs: Any = None
+        # (kind, query, max_results) -> (fetched at, raw results)
+        self._search_cache: Dict[
+            Tuple[str, str, int], Tuple[float, List[Dict[str, Any]]]
+        ] = {}
 
     def _get_ddgs(self) -> Any:
-        """Get or create DDGS instance."""
+        """Get or create the shared DDGS instance."""
         if DDGS is None:
             raise ImportError(
                 "ddgs package not found. Please install with: pip install ddgs"
             )
 
-        if self._ddgs is None:
-            self._ddgs = DDGS()
-        return self._ddgs
-
-    def search_web(
-        self, query: str, max_results: Optional[int] = None
+        if WebOperations._shared_ddgs is None:
+            with WebOperations._ddgs_lock:
+                if WebOperations._shared_ddgs is None:
+                    WebOperations._shared_ddgs = DDGS()
+        return WebOperations._shared_ddgs
+
+    def _search(self, kind: str, query: str, max_results: int) -> List[Dict[str, Any]]:
+        """Run a DDGS search, reusing results fetched within the cache TTL.
+
+        kind is the DDGS method name: text, news, images or videos.
+        """
+        cache_key = (kind, query, max_results)
+        now = time.monotonic()
+        cached = self._search_cache.get(cache_key)
+        if (
+            cached is not None
+            and now - cached[0] < settings.web_operations.SEARCH_CACHE_TTL
+        ):
+            return cached[1]
+
+        results = list(getattr(self._get_ddgs(), kind)(query, max_results=max_results))
+
+        # Empty results may be a transient failure, so they are not kept
+        if results and settings.development.CACHE_ENABLED:
+            self._search_cache.pop(cache_key, None)
+            if len(self._search_cache) >= settings.web_operations.SEARCH_CACHE_SIZE:
+                del self._search_cache[next(iter(self._search_cache))]
+            self._search_cache[cache_key] = (now, results)
+        return results
+
+    def _shorten(self, text: str, length: int) -> str:
+        """Cut text to length characters, marking the cut with an ellipsis."""
+        return f"{text[:length]}{'...' if len(text) > length else ''}"
+
+    def _run_search(
+        self, kind: str, query: str, max_results: Optional[int], verbose: bool
     ) -> Optional[List[Dict[str, Any]]]:
-        """Search the web for information."""
+        """Run one kind of search and format its results per SEARCH_KINDS."""
+        config = self.SEARCH_KINDS[kind]
         try:
             if max_results is None:
                 max_results = settings.web_operations.DEFAULT_MAX_RESULTS
 
-            ddgs = self._get_ddgs()
-
-            print(f"🔍 Searching web for: {query}")
+            print(f"{config['searching']} for: {query}")
 
-            # Perform the search
-            results = list(ddgs.text(query, max_results=max_results))
+            results = self._search(config["method"], query, max_results)
 
             if not results:
-                print("❌ No search results found")
+                print(f"❌ No {config['results']} found")
                 return None
 
-            print(f"✅ Found {len(results)} search results:")
+            print(f"✅ Found {len(results)} {config['results']}:")
 
+            fields = config["fields"]
             formatted_results = []
             for i, result in enumerate(results, 1):
                 formatted_result = {
-                    "title": result.get("title", "No title"),
-                    "url": result.get("href", ""),
-                    "snippet": result.get("body", "No description"),
+                    key: result.get(source, default) for key, source, default in fields
                 }
                 formatted_results.append(formatted_result)
 
-                print(f"\n{i}. {formatted_result['title']}")
-                print(f"   {formatted_result['url']}")
-                print(
-                    f"   {formatted_result['snippet'][: self.snippet_length]}{'...' if len(formatted_result['snippet']) > self.snippet_length else ''}"
-                )
+                if verbose:
+                    shown = dict(formatted_result)
+                    if config["shorten"]:
+                        shown[config["shorten"]] = self._shorten(
+                            shown[config["shorten"]], self.snippet_length
+                        )
+                    print(f"\n{i}. {shown['title']}")
+                    for line in config["lines"]:
+                        print(line.format_map(shown))
 
             return formatted_results
 
@@ -83,174 +197,46 @@ class WebOperations:
             print(f"❌ Search engine not available: {e}")
             return None
         except Exception as e:
-            print(f"❌ Error performing web search: {e}")
+            print(f"❌ Error performing {config['label']}: {e}")
             return None
 
+    def search_web(
+        self, query: str, max_results: Optional[int] = None, verbose: bool = False
+    ) -> Optional[List[Dict[str, Any]]]:
+        """Search the web for information."""
+        return self._run_search("web", query, max_results, verbose)
+
     def search_news(
-        self, query: str, max_results: Optional[int] = None
+        self, query: str, max_results: Optional[int] = None, verbose: bool = False
     ) -> Optional[List[Dict[str, Any]]]:
         """Search for news articles."""
-        try:
-            if max_results is None:
-                max_results = settings.web_operations.DEFAULT_MAX_RESULTS
-
-            ddgs = self._get_ddgs()
-
-            print(f"📰 Searching news for: {query}")
-
-            # Perform news search
-            results = list(ddgs.news(query, max_results=max_results))
-
-            if not results:
-                print("❌ No news results found")
-                return None
-
-            print(f"✅ Found {len(results)} news results:")
-
-            formatted_results = []
-            for i, result in enumerate(results, 1):
-                formatted_result = {
-                    "title": result.get("title", "No title"),
-                    "url": result.get("url", ""),
-                    "snippet": result.get("body", "No description"),
-                    "source": result.get("source", "Unknown"),
-                    "date": result.get("date", ""),
-                }
-                formatted_results.append(formatted_result)
-
-                print(f"\n{i}. {formatted_result['title']}")
-                print(
-                    f"   Source: {formatted_result['source']} | Date: {formatted_result['date']}"
-                )
-                print(f"   {formatted_result['url']}")
-                print(
-                    f"   {formatted_result['snippet'][: self.snippet_length]}{'...' if len(formatted_result['snippet']) > self.snippet_length else ''}"
-                )
-
-            return formatted_results
-
-        except ImportError as e:
-            print(f"❌ Search engine not available: {e}")
-            return None
-        except Exception as e:
-            print(f"❌ Error performing news search: {e}")
-            return None
+        return self._run_search("news", query, max_results, verbose)
 
     def search_images(
-        self, query: str, max_results: Optional[int] = None
+        self, query: str, max_results: Optional[int] = None, verbose: bool = False
     ) -> Optional[List[Dict[str, Any]]]:
         """Search for images."""
-        try:
-            if max_results is None:
-                max_results = settings.web_operations.DEFAULT_MAX_RESULTS
-
-            ddgs = self._get_ddgs()
-
-            print(f"🖼️ Searching images for: {query}")
-
-            # Perform image search
-            results = list(ddgs.images(query, max_results=max_results))
-
-            if not results:
-                print("❌ No image results found")
-                return None
-
-            print(f"✅ Found {len(results)} image results:")
-
-            formatted_results = []
-            for i, result in enumerate(results, 1):
-                formatted_result = {
-                    "title": result.get("title", "No title"),
-                    "image_url": result.get("image", ""),
-                    "thumbnail_url": result.get("thumbnail", ""),
-                    "source": result.get("source", ""),
-                    "width": result.get("width", 0),
-                    "height": result.get("height", 0),
-                }
-                formatted_results.append(formatted_result)
-
-                print(f"\n{i}. {formatted_result['title']}")
-                print(
-                    f"   Size: {formatted_result['width']}x{formatted_result['height']}"
-                )
-                print(f"   Image: {formatted_result['image_url']}")
-                print(f"   Source: {formatted_result['source']}")
-
-            return formatted_results
-
-        except ImportError as e:
-            print(f"❌ Search engine not available: {e}")
-            return None
-        except Exception as e:
-            print(f"❌ Error performing image search: {e}")
-            return None
+        return self._run_search("images", query, max_results, verbose)
 
     def search_videos(
-        self, query: str, max_results: Optional[int] = None
+        self, query: str, max_results: Optional[int] = None, verbose: bool = False
     ) -> Optional[List[Dict[str, Any]]]:
         """Search for videos."""
-        try:
-            if max_results is None:
-                max_results = settings.web_operations.DEFAULT_MAX_RESULTS
-
-            ddgs = self._get_ddgs()
-
-            print(f"📹 Searching videos for: {query}")
-
-            # Perform video search
-            results = list(ddgs.videos(query, max_results=max_results))
-
-            if not results:
-                print("❌ No video results found")
-                return None
-
-            print(f"✅ Found {len(results)} video results:")
-
-            formatted_results = []
-            for i, result in enumerate(results, 1):
-                formatted_result = {
-                    "title": result.get("title", "No title"),
-                    "url": result.get("content", ""),
-                    "thumbnail": result.get("thumbnail", ""),
-                    "description": result.get("description", ""),
-                    "publisher": result.get("publisher", ""),
-                    "duration": result.get("duration", ""),
-                }
-                formatted_results.append(formatted_result)
-
-                print(f"\n{i}. {formatted_result['title']}")
-                print(
-                    f"   Publisher: {formatted_result['publisher']} | Duration: {formatted_result['duration']}"
-                )
-                print(f"   {formatted_result['url']}")
-                print(
-                    f"   {formatted_result['description'][: self.snippet_length]}{'...' if len(formatted_result['description']) > self.snippet_length else ''}"
-                )
-
-            return formatted_results
-
-        except ImportError as e:
-            print(f"❌ Search engine not available: {e}")
-            return None
-        except Exception as e:
-            print(f"❌ Error performing video search: {e}")
-            return None
+        return self._run_search("videos", query, max_results, verbose)
 
     def quick_answer(self, query: str) -> Optional[str]:
         """Get a quick answer for a query."""
         try:
-            ddgs = self._get_ddgs()
-
             print(f"❓ Getting quick answer for: {query}")
 
             # Get search results and use the first one as a quick answer
-            search_results = list(ddgs.text(query, max_results=1))
+            search_results = self._search("text", query, 1)
             if search_results:
                 result = search_results[0]
                 snippet = result.get("body", "")
                 if snippet:
                     print(
-                        f"✅ Quick answer: {snippet[: self.quick_answer_length]}{'...' if len(snippet) > self.quick_answer_length else ''}"
+                        f"✅ Quick answer: {self._shorten(snippet, self.quick_answer_length)}"
                     )
                     return snippet[: self.quick_answer_length]  # type: ignore[no-any-return]
 
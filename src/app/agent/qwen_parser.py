@@ -14,9 +14,28 @@ from kani.engines.base import BaseCompletion
 from kani.model_specific.base import BaseToolCallParser
 from kani.models import FunctionCall, ToolCall
 
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
 log = logging.getLogger(__name__)
 
 
+def _json_loads(text: str) -> Any:
+    """Parse JSON with orjson when it is installed, else the json module."""
+    if orjson is not None:
+        return orjson.loads(text)
+    return json.loads(text)
+
+
+def _json_dumps(obj: Any) -> str:
+    """Serialize JSON with orjson when it is installed, else the json module."""
+    if orjson is not None:
+        return orjson.dumps(obj).decode()
+    return json.dumps(obj)
+
+
 class QwenToolCallParser(BaseToolCallParser):  # type: ignore[misc]
     """
     Tool calling parser for Qwen models that use XML-based function calling.
@@ -40,6 +59,18 @@ class QwenToolCallParser(BaseToolCallParser):  # type: ignore[misc]
             tool_call_end_token=tool_call_end_token,
             **kwargs,
         )
+        # The tokens are fixed once the parser exists, so compile the pattern
+        # here instead of rebuilding it for every completion
+        start_token = self.tool_call_start_token or "<tool_call>"
+        end_token = self.tool_call_end_token or "</tool_call>"
+        self._tool_call_re = re.compile(
+            rf"{re.escape(start_token)}\s*(.+?)\s*{re.escape(end_token)}",
+            re.IGNORECASE | re.DOTALL,
+        )
+        # Content without the start token's first character (in either case)
+        # cannot hold a tool call; "in" rules that out far faster than the regex
+        first_char = start_token[:1]
+        self._start_chars = (first_char.lower(), first_char.upper())
 
     def parse_tool_calls(self, content: str) -> Tuple[str, List[ToolCall]]:
         """
@@ -54,26 +85,21 @@ class QwenToolCallParser(BaseToolCallParser):  # type: ignore[misc]
         if not isinstance(content, str):
             return str(content), []
 
-        # Ensure tokens are strings
-        start_token = self.tool_call_start_token or "<tool_call>"
-        end_token = self.tool_call_end_token or "</tool_call>"
-
-        # Look for tool calls in XML format
-        tool_call_pattern = (
-            rf"{re.escape(start_token)}\s*(.+?)\s*{re.escape(end_token)}"
-        )
+        # Fast path for the common completion without any tool call
+        lower_char, upper_char = self._start_chars
+        if lower_char not in content and upper_char not in content:
+            return content, []
 
-        tool_calls = []
-        cleaned_content = content
+        tool_calls: List[ToolCall] = []
 
-        # Find all tool calls
-        for match in re.finditer(tool_call_pattern, content, re.IGNORECASE | re.DOTALL):
+        def collect(match: "re.Match[str]") -> str:
+            """Parse one tool call and blank it out of the content."""
             tool_json_str = match.group(1).strip()
             log.debug(f"Found tool call JSON: {tool_json_str}")
 
             try:
                 # Parse the JSON content
-                tool_data = json.loads(tool_json_str)
+                tool_data = _json_loads(tool_json_str)
 
                 # Extract function details
                 function_name = tool_data.get("name")
@@ -83,7 +109,7 @@ class QwenToolCallParser(BaseToolCallParser):  # type: ignore[misc]
                     # Create function call
                     function_call = FunctionCall(
                         name=function_name,
-                        arguments=json.dumps(function_args)
+                        arguments=_json_dumps(function_args)
                         if isinstance(function_args, dict)
                         else str(function_args),
                     )
@@ -100,15 +126,16 @@ class QwenToolCallParser(BaseToolCallParser):  # type: ignore[misc]
                 log.warning(
                     f"Failed to parse tool call JSON: {tool_json_str}, error: {e}"
                 )
-                continue
 
-        # Remove tool call XML from content if we found any
-        if tool_calls:
-            cleaned_content = re.sub(
-                tool_call_pattern, "", content, flags=re.IGNORECASE | re.DOTALL
-            ).strip()
+            return ""
+
+        # Find and strip all tool calls in one pass over the content
+        stripped_content = self._tool_call_re.sub(collect, content)
 
-        return cleaned_content, tool_calls
+        # Keep the content as-is unless a tool call was actually parsed
+        if not tool_calls:
+            return content, tool_calls
+        return stripped_content.strip(), tool_calls
 
     async def predict(
         self, messages: Any, functions: Any = None, **hyperparams: Any
@@ -182,14 +182,16 @@ Be helpful and use the appropriate function for each request."""
     def search_web(self, query: str, search_type: str = "web") -> str:
         """Search the web for information. search_type can be 'web', 'news', 'images', or 'videos'."""
         try:
+            # Only the result count goes back to the model, so print the
+            # results to the console for the user
             if search_type == "news":
-                results = self.web_ops.search_news(query)
+                results = self.web_ops.search_news(query, verbose=True)
             elif search_type == "images":
-                results = self.web_ops.search_images(query)
+                results = self.web_ops.search_images(query, verbose=True)
             elif search_type == "videos":
-                results = self.web_ops.search_videos(query)
+                results = self.web_ops.search_videos(query, verbose=True)
             else:
-                results = self.web_ops.search_web(query)
+                results = self.web_ops.search_web(query, verbose=True)
 
             if results:
                 return f"✅ Found {len(results)} results for '{query}'"
@@ -6,6 +6,7 @@ from typing import Any, Dict, Optional
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", ".."))
 
 import asyncio
+import logging
 import tempfile
 
 from fastapi import FastAPI, File, HTTPException, UploadFile
@@ -18,6 +19,13 @@ from src.app.config.settings import settings
 # Local imports
 from src.app.services.transcription_service import TranscriptionService
 
+# Show the app's own log records (FileOperations results, parser warnings) on
+# the console; third-party loggers stay at the default WARNING
+logging.basicConfig(
+    format=settings.logging.LOG_FORMAT, datefmt=settings.logging.DATE_FORMAT
+)
+logging.getLogger("src.app").setLevel(settings.logging.DEFAULT_LOG_LEVEL)
+
 # Singleton for File default
 _FILE_DEFAULT = File(...)
 
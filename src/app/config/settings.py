@@ -9,7 +9,7 @@ application settings.
 import os
 import tempfile
 from pathlib import Path
-from typing import Any, ClassVar, Dict, List
+from typing import Any, ClassVar, Dict, List, Optional
 
 
 class AudioSettings:
@@ -48,6 +48,7 @@ class ModelSettings:
 
     # Model download settings
     MODELS_DIR_NAME: str = "models"
+    # An optional "sha256" entry enables checksum verification after download
     MODEL_INFO: ClassVar[Dict[str, Dict[str, Any]]] = {
         "qwen2.5-1.5b-instruct": {
             "filename": "qwen2.5-1.5b-instruct-q4_k_m.gguf",
@@ -55,6 +56,15 @@ class ModelSettings:
             "size_mb": 950,
         }
     }
+    DOWNLOAD_TIMEOUT: float = 30.0  # Socket timeout per request
+    DOWNLOAD_CONNECTIONS: int = 8  # Parallel range requests per model
+    DOWNLOAD_CHUNK_SIZE: int = 16 * 1024 * 1024  # Bytes per range request
+    DOWNLOAD_BLOCK_SIZE: int = 1024 * 1024  # Bytes per socket read
+    DOWNLOAD_WRITE_BATCH: int = 4  # Blocks per positional write syscall
+    DOWNLOAD_SOCKET_RCVBUF: Optional[int] = None  # SO_RCVBUF; None = OS autotuning
+    DOWNLOAD_PROGRESS_INTERVAL: float = 1.0  # Seconds between progress updates
+    MAX_PARALLEL_MODEL_DOWNLOADS: int = 4  # Models fetched at once
+    DOWNLOAD_DISK_SPACE_MARGIN: float = 1.05  # Free space needed per byte
 
 
 class APISettings:
@@ -88,6 +98,13 @@ class AppOperationsSettings:
     # Platform-specific settings
     SEARCH_TIMEOUT: float = 5.0
     APP_LAUNCH_TIMEOUT: float = 15.0
+    LAUNCH_CHECK_TIMEOUT: float = 0.5  # Wait for a launcher to fail fast
+
+    # Discovered apps are cached here until a watched directory changes
+    APP_CACHE_FILE: str = os.path.join(
+        os.path.expanduser("~"), ".cache", "vaakya", "apps.json"
+    )
+    APP_CACHE_MAX_AGE: float = 24 * 60 * 60  # Seconds before a rescan regardless
 
     # Linux executable filtering
     SKIP_EXECUTABLES: ClassVar[List[str]] = [
@@ -104,6 +121,7 @@ class AppOperationsSettings:
     FUZZY_MATCH_THRESHOLD: int = 70
     BONUS_APP_NAME_LENGTH: int = 15
     PENALTY_APP_NAME_LENGTH: int = 30
+    MATCH_CACHE_SIZE: int = 256  # Remembered (query, threshold) results
 
 
 class WebOperationsSettings:
@@ -121,6 +139,10 @@ class WebOperationsSettings:
     SEARCH_TIMEOUT: float = 10.0
     REQUEST_TIMEOUT: float = 30.0
 
+    # Repeated searches within the TTL reuse the earlier results
+    SEARCH_CACHE_TTL: float = 60.0
+    SEARCH_CACHE_SIZE: int = 128
+
 
 class FileOperationsSettings:
     """File operations configuration."""
@@ -132,6 +154,7 @@ class FileOperationsSettings:
     # Size limits
     MAX_FILE_SIZE_MB: int = 100
     MAX_DIRECTORY_DEPTH: int = 10
+    SIZED_READ_THRESHOLD: int = 64 * 1024  # Larger files are read in one buffer
 
     # Temporary file settings
     TEMP_DIR_PREFIX: str = "vaakya_"